@@ -1,7 +1,5 @@
 """The Autoterm Heater integration."""
-import asyncio
 import logging
-from datetime import timedelta
 
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
@@ -9,13 +7,40 @@ from homeassistant.helpers import service
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import Platform
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_time_interval
 import async_timeout
 
-from .const import DOMAIN, CONF_SERIAL_PORT, ATTR_TEMPERATURE_ENTITY, SERVICE_UPDATE_TEMPERATURE
+from .const import (
+    DOMAIN,
+    CONF_SERIAL_PORT,
+    CONF_POLL_INTERVAL_FAST,
+    CONF_POLL_INTERVAL_IDLE,
+    CONF_POLL_INTERVAL_STEADY,
+    DEFAULT_POLL_INTERVAL_FAST,
+    DEFAULT_POLL_INTERVAL_IDLE,
+    DEFAULT_POLL_INTERVAL_STEADY,
+    CONF_TEMPERATURE_KEEPALIVE,
+    DEFAULT_TEMPERATURE_KEEPALIVE,
+    CONF_CAPTURE_TRAFFIC,
+    DEFAULT_CAPTURE_TRAFFIC,
+    CAPTURE_DIRECTORY,
+    CONF_CONTROL_INTERVAL,
+    DEFAULT_CONTROL_INTERVAL,
+    CONF_FUEL_PER_STROKE,
+    DEFAULT_FUEL_PER_STROKE,
+    CONSUMPTION_MAX_GAP_POLLS,
+    CONSUMPTION_SAVE_DELAY,
+    CONSUMPTION_STORAGE_VERSION,
+    ATTR_TEMPERATURE_ENTITY,
+    SERVICE_UPDATE_TEMPERATURE,
+)
+from .control import create_controller
 from .device import AutotermDevice
+from .external_temperature import ExternalTemperatureForwarder
+from .telemetry import TelemetryAggregator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,11 +63,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.entry_id
     )
     
+    # Restore the fuel consumption and burner runtime totals
+    consumption_store = Store(
+        hass, CONSUMPTION_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.consumption"
+    )
+    if stored := await consumption_store.async_load():
+        device.consumption.restore(stored)
+    device.consumption.ml_per_stroke = entry.options.get(
+        CONF_FUEL_PER_STROKE, DEFAULT_FUEL_PER_STROKE
+    )
+    device.consumption.max_gap = CONSUMPTION_MAX_GAP_POLLS * max(
+        entry.options.get(CONF_POLL_INTERVAL_FAST, DEFAULT_POLL_INTERVAL_FAST),
+        entry.options.get(CONF_POLL_INTERVAL_STEADY, DEFAULT_POLL_INTERVAL_STEADY),
+    )
+
+    # Start capturing first so the handshake is part of the capture
+    if entry.options.get(CONF_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC):
+        await device.start_capture(
+            hass.config.path(CAPTURE_DIRECTORY, f"{entry.entry_id}.atcap")
+        )
+
     try:
         await device.connect()
     except Exception as ex:
-        _LOGGER.error(f"Failed to connect to Autoterm device: {ex}")
-        return False
+        await device.stop_capture()
+        # Home Assistant retries the setup with its own backoff
+        raise ConfigEntryNotReady(f"Failed to connect to Autoterm device: {ex}") from ex
     
 
     # # Create update coordinator
@@ -81,103 +127,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # }
     hass.data[DOMAIN][entry.entry_id] = device
 
-    async def _resubmit_cached_external_temperature(
-        current_device: AutotermDevice, temp_entity_id: str, reason: str
-    ) -> None:
-        """Resubmit the last known valid external temperature if available."""
-        if await current_device.submit_cached_external_temperature():
-            _LOGGER.debug(
-                "Resubmitted cached external temperature because %s for %s",
-                reason,
-                temp_entity_id,
-            )
-
-    async def periodic_temp_update(now=None):
-        """Update the temperature periodically."""
-        current_device: AutotermDevice = hass.data[DOMAIN][entry.entry_id]
-        temp_entity_id = current_device.get_external_temperature_sensor()
-        if not temp_entity_id:
-            return
-
-        temp_state = hass.states.get(temp_entity_id)
-        if not temp_state:
-            _LOGGER.debug("Temperature entity %s not found", temp_entity_id)
-            await _resubmit_cached_external_temperature(
-                current_device, temp_entity_id, "sensor entity was not found"
-            )
-            return
-
-        if temp_state.state in ("unknown", "unavailable"):
-            _LOGGER.debug(
-                "Temperature entity %s has non-numeric state %s",
-                temp_entity_id,
-                temp_state.state,
-            )
-            await _resubmit_cached_external_temperature(
-                current_device,
-                temp_entity_id,
-                f"state is {temp_state.state}",
-            )
-            return
-
-        try:
-            temp_value = float(temp_state.state)
-        except (ValueError, TypeError):
-            _LOGGER.debug(
-                "Temperature entity %s has invalid numeric value %s",
-                temp_entity_id,
-                temp_state.state,
-            )
-            await _resubmit_cached_external_temperature(
-                current_device,
-                temp_entity_id,
-                "state is not numeric",
-            )
-            return
-
-        await current_device.submit_external_temperature(temp_value)
-        _LOGGER.debug(
-            "Updated heater with temperature %.2f from %s",
-            temp_value,
-            temp_entity_id,
-        )
-
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    # Update initially
-    await periodic_temp_update()
+    # Forward the selected external temperature sensor whenever it changes
+    forwarder = ExternalTemperatureForwarder(
+        hass,
+        device,
+        keepalive=entry.options.get(
+            CONF_TEMPERATURE_KEEPALIVE, DEFAULT_TEMPERATURE_KEEPALIVE
+        ),
+    )
+    entry.async_on_unload(forwarder.async_start())
+
+    # Set up status polling, the rate follows the heater phase
+    device.start_polling(
+        fast_interval=entry.options.get(
+            CONF_POLL_INTERVAL_FAST, DEFAULT_POLL_INTERVAL_FAST
+        ),
+        steady_interval=entry.options.get(
+            CONF_POLL_INTERVAL_STEADY, DEFAULT_POLL_INTERVAL_STEADY
+        ),
+        idle_interval=entry.options.get(
+            CONF_POLL_INTERVAL_IDLE, DEFAULT_POLL_INTERVAL_IDLE
+        ),
+    )
+    entry.async_on_unload(device.stop_polling)
 
-    # Schedule updates every 60 seconds (adjust as needed)
+    # Persist the totals shortly after they change and once more on unload
     entry.async_on_unload(
-        async_track_time_interval(
-            hass,
-            periodic_temp_update,
-            timedelta(seconds=60)
+        device.async_add_listener(
+            ("fuel_consumed", "burner_runtime"),
+            lambda: consumption_store.async_delay_save(
+                device.consumption.as_dict, CONSUMPTION_SAVE_DELAY
+            ),
         )
     )
-
-
-    # Set up periodic status polling
-    async def periodic_status_poll(now=None):
-        """Poll the device status periodically."""
-        device = hass.data[DOMAIN][entry.entry_id]
-        try:
-            await device.send_message('status')
-            await asyncio.sleep(0.5)  # Small delay between messages
-            await device.send_message('settings')
-        except Exception as ex:
-            _LOGGER.error(f"Error polling device status: {ex}")
-
-    # Schedule status polling every 30 seconds (adjust as needed)
     entry.async_on_unload(
-        async_track_time_interval(
-            hass,
-            periodic_status_poll,
-            timedelta(seconds=5)
-        )
+        lambda: consumption_store.async_save(device.consumption.as_dict())
     )
 
+    # Optionally control the reported temperature for fractional targets
+    if (controller := create_controller(entry.options)) is not None:
+        device.start_control_loop(
+            controller,
+            entry.options.get(CONF_CONTROL_INTERVAL, DEFAULT_CONTROL_INTERVAL),
+        )
+        entry.async_on_unload(device.stop_control_loop)
+
+    # Aggregate the status signals into hourly long-term statistics
+    telemetry = TelemetryAggregator(hass, device, entry.entry_id, entry.title)
+    entry.async_on_unload(telemetry.async_start())
+
 
     # entry.async_on_unload(
     #     entry.add_update_listener(async_reload_entry)
@@ -194,6 +195,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         device = hass.data[DOMAIN].pop(entry.entry_id)
         await device.disconnect()
+        await device.stop_capture()
     
     return unload_ok
 
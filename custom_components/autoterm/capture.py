@@ -0,0 +1,154 @@
+"""Binary capture and replay of the raw heater traffic.
+
+A capture file starts with ``MAGIC`` followed by one record per chunk of
+bytes read from or written to the port::
+
+    <d time> <B direction> <H length> <length bytes>
+
+Times are seconds since the epoch. Records are only ever appended, so a file
+cut short by a crash is still readable up to its last complete record.
+"""
+
+import asyncio
+import mmap
+import struct
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Tuple
+
+from .frame_log import DIRECTION_RX
+
+MAGIC = b"ATCAP\x00\x01\x00"
+RECORD = struct.Struct("<dBH")
+MAX_CHUNK = 0xFFFF
+
+
+class CaptureWriter:
+    """Append-only writer of a capture file.
+
+    Recording a chunk only appends it to an in-memory buffer, so it is safe
+    to call from the event loop. The owner hands the buffered records to
+    write() in an executor. Open, write and close the writer in an executor,
+    one call at a time.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open the file for appending and write the header to a new file."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self.records = 0
+        self._buffer = bytearray()
+
+    def record(self, direction: int, data: bytes | memoryview) -> None:
+        """Buffer a chunk of traffic."""
+        now = time.time()
+        for start in range(0, len(data), MAX_CHUNK):
+            chunk = data[start : start + MAX_CHUNK]
+            self._buffer += RECORD.pack(now, direction, len(chunk))
+            self._buffer += chunk
+            self.records += 1
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes."""
+        return len(self._buffer)
+
+    def take(self) -> bytes:
+        """Return the buffered records and start a new buffer."""
+        data, self._buffer = bytes(self._buffer), bytearray()
+        return data
+
+    def write(self, data: bytes) -> None:
+        """Write records returned by take() to the file."""
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the remaining records and close the file."""
+        try:
+            self._file.write(self.take())
+        finally:
+            self._file.close()
+
+
+class CaptureReader:
+    """Memory-mapped reader of a capture file.
+
+    Iterating yields ``(time, direction, data)`` tuples where data is a view
+    into the mapping, so even multi-day captures are paged in on demand
+    instead of being loaded into memory.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the file and check its header."""
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as ex:
+                raise ValueError(f"{self.path} is empty") from ex
+        self._view = memoryview(self._map)
+        if self._view[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not an Autoterm capture")
+
+    def __iter__(self) -> Iterator[Tuple[float, int, memoryview]]:
+        """Yield the records in file order."""
+        view = self._view
+        end = len(view)
+        offset = len(MAGIC)
+        unpack_from = RECORD.unpack_from
+        header_size = RECORD.size
+        while offset + header_size <= end:
+            timestamp, direction, length = unpack_from(view, offset)
+            offset += header_size
+            if offset + length > end:
+                # Truncated last record
+                return
+            yield timestamp, direction, view[offset : offset + length]
+            offset += length
+
+    def close(self) -> None:
+        """Unmap the file; views handed out must be released before."""
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> "CaptureReader":
+        """Return the reader."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the reader."""
+        self.close()
+
+
+async def replay(
+    reader: CaptureReader,
+    feed: Callable[[memoryview], None],
+    speed: float | None = 1.0,
+) -> int:
+    """Feed the received chunks of a capture to a callback.
+
+    With a speed the original timing is reproduced, scaled by the factor.
+    With ``None`` the chunks are fed as fast as possible. Returns the number
+    of chunks fed.
+    """
+    loop = asyncio.get_running_loop()
+    chunks = 0
+    first: float | None = None
+    start = loop.time()
+    for timestamp, direction, data in reader:
+        if direction != DIRECTION_RX:
+            continue
+        if speed is not None:
+            if first is None:
+                first = timestamp
+            delay = start + (timestamp - first) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        feed(data)
+        chunks += 1
+    return chunks
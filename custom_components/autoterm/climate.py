@@ -11,15 +11,17 @@ from homeassistant.components.climate import (
 from homeassistant.components.climate.const import HVACAction
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_TENTHS, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, MANUFACTURER, MODEL, TEMP_MIN, TEMP_MAX
-from .device import SIGNAL_STATE_UPDATED, AutotermDevice
+from .device import AutotermDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity keys the climate state is derived from
+CLIMATE_UPDATE_KEYS = ("control", "status_code", "temperature_target", "controller_temp")
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -54,28 +56,20 @@ class AutotermClimate(ClimateEntity):
             "model": MODEL,
             "sw_version": device.version,
         }
-        self._status_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_control")
-        self._temperature_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_temperature_target")
-        self._controller_temp_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_controller_temp")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to Home Assistant."""
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._status_updated_signal, self.async_write_ha_state
-            )
-        )
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._temperature_updated_signal, self.async_write_ha_state
-            )
-        )
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._controller_temp_updated_signal, self.async_write_ha_state
+            self._device.async_add_listener(
+                CLIMATE_UPDATE_KEYS, self.async_write_ha_state
             )
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True while the heater is connected."""
+        return self._device.available
+
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
@@ -13,7 +13,42 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
 
-from .const import CONF_SERIAL_PORT, DEFAULT_NAME, DOMAIN
+from .const import (
+    CONF_CAPTURE_TRAFFIC,
+    CONF_CONTROL_HYSTERESIS,
+    CONF_CONTROL_INTERVAL,
+    CONF_CONTROL_KI,
+    CONF_CONTROL_KP,
+    CONF_CONTROL_MODE,
+    CONF_CONTROL_OUTPUT_LIMIT,
+    CONF_DEADBAND_PREFIX,
+    CONF_FUEL_PER_STROKE,
+    CONF_MIN_INTERVAL_PREFIX,
+    CONF_POLL_INTERVAL_FAST,
+    CONF_POLL_INTERVAL_IDLE,
+    CONF_POLL_INTERVAL_STEADY,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SERIAL_PORT,
+    CONF_TEMPERATURE_KEEPALIVE,
+    CONTROL_MODES,
+    DEFAULT_CAPTURE_TRAFFIC,
+    DEFAULT_CONTROL_HYSTERESIS,
+    DEFAULT_CONTROL_INTERVAL,
+    DEFAULT_CONTROL_KI,
+    DEFAULT_CONTROL_KP,
+    DEFAULT_CONTROL_MODE,
+    DEFAULT_CONTROL_OUTPUT_LIMIT,
+    DEFAULT_FUEL_PER_STROKE,
+    DEFAULT_NAME,
+    DEFAULT_POLL_INTERVAL_FAST,
+    DEFAULT_POLL_INTERVAL_IDLE,
+    DEFAULT_POLL_INTERVAL_STEADY,
+    DEFAULT_SENSOR_MAX_AGE,
+    DEFAULT_TEMPERATURE_KEEPALIVE,
+    DOMAIN,
+    SENSOR_WRITE_FILTERS,
+)
+from .network import is_network_url, test_network_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +67,36 @@ async def _async_get_port_options(
     ]
 
 
+def _seconds_selector(maximum: int, minimum: int = 1) -> selector.NumberSelector:
+    """Return a selector for an interval in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+
+def _number_selector(
+    minimum: float,
+    maximum: float | None,
+    step: float | str,
+    unit: str | None = None,
+) -> selector.NumberSelector:
+    """Return a selector for a number entered in a box."""
+    config = selector.NumberSelectorConfig(
+        min=minimum, step=step, mode=selector.NumberSelectorMode.BOX
+    )
+    if maximum is not None:
+        config["max"] = maximum
+    if unit is not None:
+        config["unit_of_measurement"] = unit
+    return selector.NumberSelector(config)
+
+
 class AutotermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Autoterm."""
 
@@ -69,6 +134,7 @@ class AutotermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         selector.SelectSelectorConfig(
                             options=port_options,
                             mode=selector.SelectSelectorMode.DROPDOWN,
+                            custom_value=True,
                         )
                     ),
                 }
@@ -78,7 +144,13 @@ class AutotermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     def _test_connection(port: str) -> None:
-        """Test if the port is available."""
+        """Test if the port or network bridge is available."""
+        if is_network_url(port):
+            try:
+                test_network_url(port)
+            except (OSError, ValueError):
+                raise CannotConnect
+            return
         ser = None
         try:
             ser = serial.Serial(port, 9600, timeout=1)
@@ -103,6 +175,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._options: dict[str, Any] = {}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -128,10 +201,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
-                return self.async_create_entry(title="", data={})
+                self._options = {
+                    key: value
+                    for key, value in user_input.items()
+                    if key != CONF_SERIAL_PORT
+                }
+                return await self.async_step_control()
 
         port_options = await _async_get_port_options(self.hass)
         current_port = self.config_entry.data.get(CONF_SERIAL_PORT, "")
+        options = self.config_entry.options
 
         return self.async_show_form(
             step_id="init",
@@ -143,13 +222,135 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         selector.SelectSelectorConfig(
                             options=port_options,
                             mode=selector.SelectSelectorMode.DROPDOWN,
+                            custom_value=True,
                         )
                     ),
+                    vol.Required(
+                        CONF_POLL_INTERVAL_FAST,
+                        default=options.get(
+                            CONF_POLL_INTERVAL_FAST, DEFAULT_POLL_INTERVAL_FAST
+                        ),
+                    ): _seconds_selector(60),
+                    vol.Required(
+                        CONF_POLL_INTERVAL_STEADY,
+                        default=options.get(
+                            CONF_POLL_INTERVAL_STEADY, DEFAULT_POLL_INTERVAL_STEADY
+                        ),
+                    ): _seconds_selector(600),
+                    vol.Required(
+                        CONF_POLL_INTERVAL_IDLE,
+                        default=options.get(
+                            CONF_POLL_INTERVAL_IDLE, DEFAULT_POLL_INTERVAL_IDLE
+                        ),
+                    ): _seconds_selector(600),
+                    vol.Required(
+                        CONF_TEMPERATURE_KEEPALIVE,
+                        default=options.get(
+                            CONF_TEMPERATURE_KEEPALIVE, DEFAULT_TEMPERATURE_KEEPALIVE
+                        ),
+                    ): _seconds_selector(600),
+                    vol.Required(
+                        CONF_CAPTURE_TRAFFIC,
+                        default=options.get(
+                            CONF_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_FUEL_PER_STROKE,
+                        default=options.get(
+                            CONF_FUEL_PER_STROKE, DEFAULT_FUEL_PER_STROKE
+                        ),
+                    ): _number_selector(0.001, 1, "any", "ml"),
                 }
             ),
             errors=errors,
         )
 
+    async def async_step_control(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the control of the reported temperature."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return await self.async_step_sensor_filters()
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="control",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_CONTROL_MODE,
+                        default=options.get(CONF_CONTROL_MODE, DEFAULT_CONTROL_MODE),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=CONTROL_MODES,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_CONTROL_MODE,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_CONTROL_INTERVAL,
+                        default=options.get(
+                            CONF_CONTROL_INTERVAL, DEFAULT_CONTROL_INTERVAL
+                        ),
+                    ): _seconds_selector(300),
+                    vol.Required(
+                        CONF_CONTROL_HYSTERESIS,
+                        default=options.get(
+                            CONF_CONTROL_HYSTERESIS, DEFAULT_CONTROL_HYSTERESIS
+                        ),
+                    ): _number_selector(0, 2, 0.1, "°C"),
+                    vol.Required(
+                        CONF_CONTROL_KP,
+                        default=options.get(CONF_CONTROL_KP, DEFAULT_CONTROL_KP),
+                    ): _number_selector(0, 10, "any"),
+                    vol.Required(
+                        CONF_CONTROL_KI,
+                        default=options.get(CONF_CONTROL_KI, DEFAULT_CONTROL_KI),
+                    ): _number_selector(0, 1, "any"),
+                    vol.Required(
+                        CONF_CONTROL_OUTPUT_LIMIT,
+                        default=options.get(
+                            CONF_CONTROL_OUTPUT_LIMIT, DEFAULT_CONTROL_OUTPUT_LIMIT
+                        ),
+                    ): _number_selector(1, 10, 0.5, "°C"),
+                }
+            ),
+        )
+
+    async def async_step_sensor_filters(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the deadband and rate limit of the measurement sensors."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self._options, **user_input}
+            )
+
+        options = self.config_entry.options
+        schema: dict[Any, Any] = {
+            vol.Required(
+                CONF_SENSOR_MAX_AGE,
+                default=options.get(CONF_SENSOR_MAX_AGE, DEFAULT_SENSOR_MAX_AGE),
+            ): _seconds_selector(3600),
+        }
+        for key, (deadband, min_interval) in SENSOR_WRITE_FILTERS.items():
+            deadband_key = f"{CONF_DEADBAND_PREFIX}{key}"
+            min_interval_key = f"{CONF_MIN_INTERVAL_PREFIX}{key}"
+            schema[
+                vol.Required(deadband_key, default=options.get(deadband_key, deadband))
+            ] = _number_selector(0, None, "any")
+            schema[
+                vol.Required(
+                    min_interval_key, default=options.get(min_interval_key, min_interval)
+                )
+            ] = _seconds_selector(600, minimum=0)
+
+        return self.async_show_form(
+            step_id="sensor_filters", data_schema=vol.Schema(schema)
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
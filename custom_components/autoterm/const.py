@@ -7,6 +7,23 @@ MODEL = "Air 2D"
 # Config
 CONF_SERIAL_PORT = "serial_port"
 
+# Options
+CONF_POLL_INTERVAL_FAST = "poll_interval_fast"
+CONF_POLL_INTERVAL_STEADY = "poll_interval_steady"
+CONF_POLL_INTERVAL_IDLE = "poll_interval_idle"
+CONF_TEMPERATURE_KEEPALIVE = "temperature_keepalive"
+CONF_CAPTURE_TRAFFIC = "capture_traffic"
+CONF_SENSOR_MAX_AGE = "sensor_max_age"
+CONF_CONTROL_MODE = "control_mode"
+CONF_CONTROL_INTERVAL = "control_interval"
+CONF_CONTROL_HYSTERESIS = "control_hysteresis"
+CONF_CONTROL_KP = "control_kp"
+CONF_CONTROL_KI = "control_ki"
+CONF_CONTROL_OUTPUT_LIMIT = "control_output_limit"
+CONF_FUEL_PER_STROKE = "fuel_per_stroke"
+CONF_DEADBAND_PREFIX = "deadband_"
+CONF_MIN_INTERVAL_PREFIX = "min_interval_"
+
 
 # Constants for service
 SERVICE_UPDATE_TEMPERATURE = "update_external_temperature"
@@ -14,6 +31,103 @@ ATTR_TEMPERATURE_ENTITY = "temperature_entity_id"
 
 # Defaults
 DEFAULT_NAME = "Autoterm Heater"
+DEFAULT_POLL_INTERVAL_FAST = 2
+DEFAULT_POLL_INTERVAL_STEADY = 15
+DEFAULT_POLL_INTERVAL_IDLE = 60
+DEFAULT_TEMPERATURE_KEEPALIVE = 60
+DEFAULT_CAPTURE_TRAFFIC = False
+DEFAULT_SENSOR_MAX_AGE = 600
+# Milliliters of fuel delivered per fuel pump stroke
+DEFAULT_FUEL_PER_STROKE = 0.022
+
+# Fuel consumption and burner runtime totals
+CONSUMPTION_STORAGE_VERSION = 1
+# Seconds the totals may be unsaved
+CONSUMPTION_SAVE_DELAY = 60
+# A pump frequency is integrated for at most this many polling intervals
+CONSUMPTION_MAX_GAP_POLLS = 3
+
+# Control of the reported temperature for fractional targets
+CONTROL_MODE_STATIC = "static"
+CONTROL_MODE_HYSTERESIS = "hysteresis"
+CONTROL_MODE_PI = "pi"
+CONTROL_MODES = [CONTROL_MODE_STATIC, CONTROL_MODE_HYSTERESIS, CONTROL_MODE_PI]
+DEFAULT_CONTROL_MODE = CONTROL_MODE_STATIC
+DEFAULT_CONTROL_INTERVAL = 10
+DEFAULT_CONTROL_HYSTERESIS = 0.2
+DEFAULT_CONTROL_KP = 1.0
+DEFAULT_CONTROL_KI = 0.002
+DEFAULT_CONTROL_OUTPUT_LIMIT = 3.0
+
+# Default (deadband, minimum seconds between writes) of the measurement
+# sensors; other sensors write every change
+SENSOR_WRITE_FILTERS = {
+    "board_temp": (1, 10),
+    "voltage": (0.2, 30),
+    "flame_temperature": (5, 10),
+    "fan_rpm_specified": (60, 10),
+    "fan_rpm_actual": (120, 10),
+    "frequency_fuel_pump": (0.05, 10),
+    "frequency_fuel_pump_actual": (0.05, 10),
+    "glow_plug_current": (0.5, 10),
+    "controller_temp": (0.5, 10),
+}
+
+# Directory below the config directory for traffic captures
+CAPTURE_DIRECTORY = "autoterm_captures"
+
+# Captured bytes buffered in memory before they are written out, and the
+# longest seconds a capture record stays in memory
+CAPTURE_FLUSH_SIZE = 64 * 1024
+CAPTURE_FLUSH_INTERVAL = 5.0
+
+# Key in hass.data[DOMAIN] of the temperature sensor index shared by all entries
+DATA_TEMPERATURE_SENSOR_INDEX = "temperature_sensor_index"
+
+# Seconds of fast polling after a command was sent
+POLL_BOOST_DURATION = 30
+
+# Seconds to wait for the heater to answer a request
+RESPONSE_TIMEOUT = 2.0
+
+# Seconds a command may take until the heater reports the requested state
+CONFIRM_TIMEOUT = 5.0
+
+# Minimum seconds between two frames written to the bus
+FRAME_SPACING = 0.1
+
+# Reconnect backoff in seconds, doubled per failed attempt with jitter
+RECONNECT_BACKOFF_INITIAL = 1
+RECONNECT_BACKOFF_MAX = 300
+
+# Seconds between updates of the latency diagnostic sensors
+LATENCY_REPORT_INTERVAL = 30
+
+# Consecutive unanswered requests after which the port is considered dead
+DEAD_PORT_TIMEOUTS = 3
+
+# Status signals aggregated into long-term statistics
+TELEMETRY_KEYS = (
+    "flame_temperature",
+    "voltage",
+    "fan_rpm_actual",
+    "frequency_fuel_pump_actual",
+)
+
+# Connection states
+CONNECTION_STATE_CONNECTED = "connected"
+CONNECTION_STATE_CONNECTING = "connecting"
+CONNECTION_STATE_DISCONNECTED = "disconnected"
+CONNECTION_STATES = [
+    CONNECTION_STATE_CONNECTED,
+    CONNECTION_STATE_CONNECTING,
+    CONNECTION_STATE_DISCONNECTED,
+]
+
+# Writer queue priorities, lower values are written first
+PRIORITY_CONTROL = 0
+PRIORITY_TEMPERATURE = 1
+PRIORITY_POLL = 2
 
 # Temp ranges
 TEMP_MIN = 0
@@ -127,6 +241,11 @@ STATUS_OPTIONS = {
     "4.0": "shutting_down"
 }
 
+# Status codes polled at the idle and steady intervals, all other phases
+# (start-up, ignition, cool-down, shutdown) are polled at the fast interval
+IDLE_STATUS_CODES = {"0.1"}
+STEADY_STATUS_CODES = {"3.0", "3.35", "3.5"}
+
 # Error messages
 ERROR_PROCESS_STATUS_MESSAGE = "Cannot process status message: "
 ERROR_PROCESS_SETTINGS_MESSAGE = "Cannot process settings message: "
@@ -0,0 +1,60 @@
+"""Fuel consumption and burner runtime integrated from the status frames."""
+
+from typing import Any, Dict
+
+
+class ConsumptionIntegrator:
+    """Integrate the fuel pump frequency into fuel volume and runtime.
+
+    The pump frequency is held from one status frame to the next, so each
+    frame costs one multiplication no matter how far apart they are. Gaps
+    without status frames are integrated for at most ``max_gap`` seconds, and
+    nothing is integrated while no frequency is known (e.g. disconnected).
+    """
+
+    def __init__(self, ml_per_stroke: float, max_gap: float) -> None:
+        """Initialize the integrator with zero totals."""
+        self.ml_per_stroke = ml_per_stroke
+        self.max_gap = max_gap
+        self.fuel_ml = 0.0
+        self.runtime = 0.0
+        self._frequency: float | None = None
+        self._since: float | None = None
+
+    def advance(self, now: float) -> bool:
+        """Integrate the held frequency up to now; return True if totals grew."""
+        frequency, since = self._frequency, self._since
+        self._since = now
+        if not frequency or since is None:
+            return False
+        elapsed = min(now - since, self.max_gap)
+        if elapsed <= 0:
+            return False
+        self.fuel_ml += frequency * elapsed * self.ml_per_stroke
+        self.runtime += elapsed
+        return True
+
+    def hold(self, frequency: float | None, now: float) -> bool:
+        """Integrate up to now and hold a new frequency (None pauses)."""
+        grew = self.advance(now)
+        self._frequency = frequency
+        return grew
+
+    @property
+    def fuel_liters(self) -> float:
+        """Return the fuel consumed in liters."""
+        return round(self.fuel_ml / 1000, 3)
+
+    @property
+    def runtime_hours(self) -> float:
+        """Return the burner runtime in hours."""
+        return round(self.runtime / 3600, 3)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the totals to persist."""
+        return {"fuel_ml": self.fuel_ml, "runtime": self.runtime}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Restore persisted totals."""
+        self.fuel_ml = float(data.get("fuel_ml", 0.0))
+        self.runtime = float(data.get("runtime", 0.0))
@@ -0,0 +1,130 @@
+"""Local control of the temperature reported to the heater.
+
+The heater only accepts integer targets and temperatures and regulates on
+``heater_target - reported``. To hold a fractional target the device chooses
+the reported integer itself: a controller turns the error between the
+requested target and the external reading into the offset the heater sees.
+An output of ``target - measured`` reproduces the static compensation.
+"""
+
+import math
+from typing import Any, Mapping
+
+from .const import (
+    CONF_CONTROL_HYSTERESIS,
+    CONF_CONTROL_KI,
+    CONF_CONTROL_KP,
+    CONF_CONTROL_MODE,
+    CONF_CONTROL_OUTPUT_LIMIT,
+    CONTROL_MODE_HYSTERESIS,
+    CONTROL_MODE_PI,
+    DEFAULT_CONTROL_HYSTERESIS,
+    DEFAULT_CONTROL_KI,
+    DEFAULT_CONTROL_KP,
+    DEFAULT_CONTROL_MODE,
+    DEFAULT_CONTROL_OUTPUT_LIMIT,
+)
+
+
+class HysteresisController:
+    """Call for heat below the target and stop above it, with a dead zone."""
+
+    def __init__(self, hysteresis: float, output_limit: float) -> None:
+        """Initialize the controller."""
+        self.hysteresis = hysteresis
+        self.output_limit = output_limit
+        self.calling = False
+
+    def reset(self) -> None:
+        """Forget the switching state."""
+        self.calling = False
+
+    def output(self, error: float) -> float:
+        """Return the offset for an error without advancing the controller."""
+        calling = self._calling(error)
+        return self.output_limit if calling else -self.output_limit
+
+    def update(self, error: float, elapsed: float) -> float:
+        """Advance the controller by one step and return the offset."""
+        self.calling = self._calling(error)
+        return self.output(error)
+
+    def _calling(self, error: float) -> bool:
+        """Return True if the heater should heat at this error."""
+        if error > self.hysteresis:
+            return True
+        if error < -self.hysteresis:
+            return False
+        return self.calling
+
+
+class PIController:
+    """Proportional-integral controller with a clamped output.
+
+    Anti-windup by conditional integration: the integral only grows while
+    the output is not saturated in the direction of the error, and it is
+    clamped to the output limit, so it recovers quickly after a long
+    saturation such as the warm-up phase.
+    """
+
+    def __init__(self, kp: float, ki: float, output_limit: float) -> None:
+        """Initialize the controller."""
+        self.kp = kp
+        self.ki = ki
+        self.output_limit = output_limit
+        self.integral = 0.0
+
+    def reset(self) -> None:
+        """Clear the integral."""
+        self.integral = 0.0
+
+    def _clamp(self, value: float) -> float:
+        """Limit a value to the output range."""
+        return max(-self.output_limit, min(self.output_limit, value))
+
+    def output(self, error: float) -> float:
+        """Return the offset for an error without advancing the controller."""
+        return self._clamp(self.kp * error + self.integral)
+
+    def update(self, error: float, elapsed: float) -> float:
+        """Advance the controller by elapsed seconds and return the offset."""
+        unclamped = self.kp * error + self.integral
+        saturated = abs(unclamped) >= self.output_limit
+        if not saturated or (unclamped > 0) != (error > 0):
+            self.integral = self._clamp(self.integral + self.ki * error * elapsed)
+        return self.output(error)
+
+
+Controller = HysteresisController | PIController
+
+
+def reported_temperature(
+    value: float, target: float, heater_target: int, controller: Controller | None
+) -> int:
+    """Return the integer temperature to report for a reading.
+
+    The heater regulates on ``heater_target - reported``, so the reported
+    value is chosen to make this difference the controller output. Without a
+    controller the output is the plain error, i.e. the static compensation.
+    """
+    error = target - value
+    offset = error if controller is None else controller.output(error)
+    return math.floor(heater_target - offset)
+
+
+def create_controller(options: Mapping[str, Any]) -> Controller | None:
+    """Return the controller configured in the entry options, if any."""
+    mode = options.get(CONF_CONTROL_MODE, DEFAULT_CONTROL_MODE)
+    output_limit = options.get(CONF_CONTROL_OUTPUT_LIMIT, DEFAULT_CONTROL_OUTPUT_LIMIT)
+    if mode == CONTROL_MODE_HYSTERESIS:
+        return HysteresisController(
+            options.get(CONF_CONTROL_HYSTERESIS, DEFAULT_CONTROL_HYSTERESIS),
+            output_limit,
+        )
+    if mode == CONTROL_MODE_PI:
+        return PIController(
+            options.get(CONF_CONTROL_KP, DEFAULT_CONTROL_KP),
+            options.get(CONF_CONTROL_KI, DEFAULT_CONTROL_KI),
+            output_limit,
+        )
+    return None
@@ -4,13 +4,11 @@ import asyncio
 import logging
 import math
 import struct
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
-import serial
-import serial.tools.list_ports
-
-from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     DIAG_MESSAGE_IDS,
@@ -20,14 +18,109 @@ from .const import (
     MESSAGE_IDS,
     MESSAGE_IDS_REV,
     MESSAGE_TYPES,
+    CAPTURE_FLUSH_INTERVAL,
+    CAPTURE_FLUSH_SIZE,
+    FRAME_SPACING,
+    CONFIRM_TIMEOUT,
+    CONNECTION_STATE_CONNECTED,
+    DEFAULT_FUEL_PER_STROKE,
+    DEFAULT_POLL_INTERVAL_STEADY,
+    CONSUMPTION_MAX_GAP_POLLS,
+    LATENCY_REPORT_INTERVAL,
     MODE_OPTIONS,
+    PRIORITY_CONTROL,
+    PRIORITY_POLL,
+    PRIORITY_TEMPERATURE,
+    RESPONSE_TIMEOUT,
     SENSOR_OPTIONS,
-    STATUS_OPTIONS,
 )
+from .protocol import (
+    CHECKSUM_LENGTH,
+    HEADER_LENGTH,
+    SETTINGS_CODEC,
+    STATUS_CODEC,
+    FrameParser,
+    SettingsRecord,
+    StatusRecord,
+    build_frame,
+    verify_checksum,
+)
+from .capture import CaptureWriter
+from .consumption import ConsumptionIntegrator
+from .control import Controller, reported_temperature
+from .frame_log import DIRECTION_RX, DIRECTION_TX, FrameRingBuffer
+from .latency import LatencyTracker
+from .polling import AutotermPoller
+from .supervisor import ConnectionSupervisor
+from .transport import open_connection
 
 _LOGGER = logging.getLogger(__name__)
 
-SIGNAL_STATE_UPDATED = "autoterm_state_updated_{}"
+# Derived entity keys (controller_temp, control) recomputed when an input changes
+DERIVED_KEYS_BY_INPUT = {
+    "board_temp": ("controller_temp",),
+    "sensor": ("controller_temp",),
+    "temperature_target": ("controller_temp",),
+    "temperature_panel": ("controller_temp",),
+    "status_code": ("control",),
+}
+
+
+class AutotermProtocol(asyncio.Protocol):
+    """Bridge between the serial transport and an Autoterm device."""
+
+    def __init__(self, device: "AutotermDevice") -> None:
+        """Initialize the protocol."""
+        self._device = device
+
+    def data_received(self, data: bytes) -> None:
+        """Forward received bytes to the device."""
+        self._device._handle_data(data)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Forward connection loss to the device."""
+        self._device._handle_connection_lost(exc)
+
+
+class _OutgoingFrame:
+    """A frame waiting in the writer queue."""
+
+    __slots__ = ("key", "message_id", "data", "sent", "responses")
+
+    def __init__(self, key: str, message_id: int, data: bytes) -> None:
+        """Initialize the queued frame."""
+        self.key = key
+        self.message_id = message_id
+        self.data = data
+        self.sent: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.responses: List[asyncio.Future] = []
+
+    @property
+    def payload(self) -> bytes:
+        """Return the payload carried by the frame."""
+        return self.data[HEADER_LENGTH:-CHECKSUM_LENGTH]
+
+    def fail(self, exc: Exception) -> None:
+        """Fail the frame and everyone waiting for its response."""
+        for future in (self.sent, *self.responses):
+            if not future.done():
+                future.set_exception(exc)
+
+
+class CommandNotConfirmed(HomeAssistantError):
+    """The heater did not report the requested state in time."""
+
+
+class _PendingConfirmation:
+    """Optimistic entity values waiting for the heater to report them."""
+
+    __slots__ = ("values", "confirmed", "future")
+
+    def __init__(self, values: Dict[str, Any], confirmed: Callable[[], bool]) -> None:
+        """Initialize the confirmation."""
+        self.values = values
+        self.confirmed = confirmed
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
 
 
 class AutotermDevice:
@@ -39,244 +132,577 @@ class AutotermDevice:
         self.port = port
         self.loop = loop
         self.entry_id = entry_id
-        self.serial = None
+        self.transport: asyncio.Transport | None = None
         self.settings = None
         self.version = None
         self._entities = {}
-        self._writer_lock = asyncio.Lock()
-        self._running = False
-        self._read_task = None
+        self._write_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queued_polls: Dict[Tuple[str, bytes], _OutgoingFrame] = {}
+        self._write_sequence = 0
+        self._last_write = 0.0
+        self._writer_task: asyncio.Task | None = None
+        self._command_listeners: List[Callable[[], None]] = []
+        self._update_listeners: Dict[str, List[CALLBACK_TYPE]] = {}
+        self._pending_updates: set = set()
+        self._flush_scheduled = False
+        self.parser = FrameParser()
+        self._connection_closed: asyncio.Future | None = None
+        self._closing = False
+        self.supervisor = ConnectionSupervisor(self)
+        self.latency = LatencyTracker(RESPONSE_TIMEOUT)
+        self.frame_log = FrameRingBuffer()
+        self.capture: CaptureWriter | None = None
+        self._capture_task: asyncio.Task | None = None
+        self._capture_wakeup = asyncio.Event()
+        self.poller: AutotermPoller | None = None
+        self._latency_report: asyncio.TimerHandle | None = None
+        self.controller: Controller | None = None
+        self._control_interval = 0.0
+        self._control_timer: asyncio.TimerHandle | None = None
+        self._control_last: float | None = None
+        self.consumption = ConsumptionIntegrator(
+            DEFAULT_FUEL_PER_STROKE,
+            DEFAULT_POLL_INTERVAL_STEADY * CONSUMPTION_MAX_GAP_POLLS,
+        )
+        self._pending_responses: Dict[int, List[asyncio.Future]] = {}
+        self._optimistic: Dict[str, Any] = {}
+        self._confirmations: List[_PendingConfirmation] = []
 
         # State data
-        self.status_data = {}
-        self.settings_data = {}
+        self.status_data: StatusRecord = STATUS_CODEC.new_record()
+        self.settings_data: SettingsRecord = SETTINGS_CODEC.new_record()
         self.temperature_data = 0
         self.temperature_target_requested: float | None = None
         self.external_temperature_current: float | None = None
         self.external_temperature_sensor = None
+        self._last_submitted_temperature: int | None = None
+        self._last_temperature_submit: float | None = None
         self.control = "off"
+        self._last_status_payload: bytes | None = None
+        self._last_settings_payload: bytes | None = None
+        self._last_temperature_payload: bytes | None = None
+        self._derived_state: Dict[str, Any] = {}
+        self._state_resolvers = self._build_state_resolvers()
 
     async def connect(self) -> bool:
         """Connect to the device."""
         try:
-            self.serial = await self.loop.run_in_executor(
-                None, lambda: serial.Serial(self.port, baudrate=9600, timeout=1)
-            )
-
-            # Start serial read task
-            self._running = True
-            self._read_task = self.loop.create_task(self._read_serial())
+            self._closing = False
+            await self._open_transport()
+            self._writer_task = self.loop.create_task(self._writer())
 
             # Initial device information request
-            await self.send_message("version")
-            await asyncio.sleep(0.5)
-            await self.send_message("status")
-            await asyncio.sleep(0.5)
-            await self.send_message("settings")
+            self.supervisor.connection_established(await self._handshake())
 
             return True
         except Exception as ex:
             _LOGGER.error(f"Failed to connect to Autoterm device: {ex}")
             raise
 
+    async def _open_transport(self) -> None:
+        """Open the serial port or network bridge given by self.port."""
+        self._connection_closed = self.loop.create_future()
+        self.transport, _ = await open_connection(
+            self.loop, lambda: AutotermProtocol(self), self.port, baudrate=9600
+        )
+
+    async def _handshake(self) -> bool:
+        """Request version, status and settings; return True if the heater answered."""
+        try:
+            answers = [
+                await self._try_request("version"),
+                await self._try_request("status"),
+                await self._try_request("settings"),
+            ]
+            if any(answer is not None for answer in answers):
+                await self.submit_cached_external_temperature(force=True)
+                return True
+        except ConnectionError as ex:
+            _LOGGER.warning(f"Connection lost during handshake: {ex}")
+        return False
+
+    @property
+    def available(self) -> bool:
+        """Return True while the heater is connected and answering."""
+        return self.supervisor.state == CONNECTION_STATE_CONNECTED
+
     async def disconnect(self) -> None:
         """Disconnect from the device."""
-        self._running = False
-        if self._read_task:
-            self._read_task.cancel()
+        self._closing = True
+        # Stop everything that sends on its own before tearing down
+        self.stop_control_loop()
+        await self.stop_polling()
+        await self.supervisor.stop()
+        if self._latency_report:
+            self._latency_report.cancel()
+            self._latency_report = None
+        if self._writer_task:
+            self._writer_task.cancel()
             try:
-                await self._read_task
+                await self._writer_task
             except asyncio.CancelledError:
                 pass
+            self._writer_task = None
+        if self.transport:
+            self.transport.close()
+            # Wait until the port is actually released so it can be reopened.
+            await asyncio.shield(self._connection_closed)
+        self.parser.reset()
+
+    def start_polling(
+        self, fast_interval: float, steady_interval: float, idle_interval: float
+    ) -> None:
+        """Poll status and settings at a rate that follows the heater phase."""
+        self.poller = AutotermPoller(self, fast_interval, steady_interval, idle_interval)
+        self.poller.start()
+
+    async def stop_polling(self) -> None:
+        """Stop polling."""
+        if self.poller is None:
+            return
+        poller, self.poller = self.poller, None
+        await poller.stop()
+
+    async def start_capture(self, path: str) -> None:
+        """Append the raw traffic in both directions to a capture file."""
+        await self.stop_capture()
+        capture = await self.hass.async_add_executor_job(CaptureWriter, path)
+        self.capture = capture
+        self._capture_task = self.loop.create_task(self._write_capture(capture))
+        _LOGGER.info("Capturing traffic of %s to %s", self.port, path)
+
+    async def stop_capture(self) -> None:
+        """Stop capturing and close the capture file."""
+        if self.capture is None:
+            return
+        capture, self.capture = self.capture, None
+        # The writer task writes what is buffered and returns
+        self._capture_wakeup.set()
+        if self._capture_task is not None:
+            await self._capture_task
+            self._capture_task = None
+        await self.hass.async_add_executor_job(capture.close)
 
-        if self.serial:
-            await self.loop.run_in_executor(None, self.serial.close)
-            self.serial = None
-
-    async def _read_serial(self) -> None:
-        """Task to read data from the serial port."""
-        while self._running:
+    @callback
+    def _record_capture(self, direction: int, data: bytes | memoryview) -> None:
+        """Buffer traffic for the capture file without touching the disk."""
+        self.capture.record(direction, data)
+        if self.capture.pending >= CAPTURE_FLUSH_SIZE:
+            self._capture_wakeup.set()
+
+    async def _write_capture(self, capture: CaptureWriter) -> None:
+        """Write the buffered capture records in an executor.
+
+        Records are written once CAPTURE_FLUSH_SIZE bytes are buffered or
+        CAPTURE_FLUSH_INTERVAL seconds passed, one write at a time so the
+        file keeps the order of the traffic.
+        """
+        while self.capture is capture:
+            try:
+                await asyncio.wait_for(
+                    self._capture_wakeup.wait(), CAPTURE_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._capture_wakeup.clear()
+            if not capture.pending:
+                continue
             try:
-                # Check if data is available
-                if self.serial.in_waiting:
-                    # Read byte by byte until we find the start marker (0xAA)
-                    start_byte = await self.loop.run_in_executor(
-                        None, self.serial.read, 1
-                    )
-                    if start_byte and start_byte[0] == 0xAA:
-                        # Read the type byte
-                        type_byte = await self.loop.run_in_executor(
-                            None, self.serial.read, 1
-                        )
-                        if type_byte:
-                            # Read length byte
-                            length_byte = await self.loop.run_in_executor(
-                                None, self.serial.read, 1
-                            )
-                            if length_byte:
-                                payload_length = length_byte[0]
-                                # Read the rest of the message (padding byte + id + payload + 2 checksum bytes)
-                                rest_of_message = await self.loop.run_in_executor(
-                                    None, self.serial.read, 2 + payload_length + 2
-                                )
-                                if len(rest_of_message) == 2 + payload_length + 2:
-                                    # Construct the full message
-                                    full_message = (
-                                        start_byte
-                                        + type_byte
-                                        + length_byte
-                                        + rest_of_message
-                                    )
-                                    # Process the message
-                                    await self.process_message(full_message)
-                else:
-                    # No data available, sleep a bit
-                    await asyncio.sleep(0.01)
-            except Exception as ex:
-                _LOGGER.error(f"Error reading from serial port: {ex}")
-                await asyncio.sleep(1)  # Sleep before retrying
+                await self.hass.async_add_executor_job(capture.write, capture.take())
+            except OSError as ex:
+                _LOGGER.warning("Error writing capture %s: %s", capture.path, ex)
+
+    @callback
+    def _handle_data(self, data: bytes) -> None:
+        """Feed received bytes to the frame parser and process every frame."""
+        if self.capture is not None:
+            self._record_capture(DIRECTION_RX, data)
+        for frame in self.parser.feed(data):
+            self.process_message(frame)
+
+    @callback
+    def _handle_connection_lost(self, exc: Exception | None) -> None:
+        """Handle the serial transport going away."""
+        if exc is not None:
+            _LOGGER.error(f"Error reading from serial port: {exc}")
+        elif not self._closing:
+            _LOGGER.warning("Connection to %s was closed", self.port)
+        self.transport = None
+        self.parser.reset()
+        exc = ConnectionError("Connection to the heater was lost")
+        self._fail_queued_frames(exc)
+        self._fail_pending_responses(exc)
+        self.latency.discard_pending()
+        # No pump frequency is known until the next status frame
+        self.consumption.hold(None, self.loop.time())
+        if self._connection_closed and not self._connection_closed.done():
+            self._connection_closed.set_result(None)
+        if not self._closing:
+            self.supervisor.connection_lost()
 
     @callback
     def register_entity(self, entity_key: str, entity) -> None:
         """Register an entity with the device."""
         self._entities[entity_key] = entity
 
+    def _build_state_resolvers(self) -> Dict[str, Callable[[], Any]]:
+        """Map every entity key to a function returning its current value."""
+        resolvers: Dict[str, Callable[[], Any]] = {}
+        for record in (self.settings_data, self.status_data):
+            for key in record.keys:
+                resolvers[key] = partial(getattr, record, key)
+        resolvers["temperature_target"] = self._get_temperature_target
+        resolvers["controller_temp"] = partial(
+            self._get_derived_state, "controller_temp", self._compute_controller_temp
+        )
+        resolvers["control"] = partial(
+            self._get_derived_state, "control", self._compute_control
+        )
+        resolvers["fuel_consumed"] = partial(getattr, self.consumption, "fuel_liters")
+        resolvers["burner_runtime"] = partial(getattr, self.consumption, "runtime_hours")
+        resolvers["connection_state"] = partial(getattr, self.supervisor, "state")
+        for percent in (50, 95, 99):
+            resolvers[f"latency_p{percent}"] = partial(
+                self.latency.percentile_ms, percent
+            )
+        resolvers["response_timeouts"] = partial(getattr, self.latency, "timeouts")
+        for key in ("reconnects", "connection_failures"):
+            resolvers[key] = partial(getattr, self.supervisor, key)
+        return resolvers
+
     @callback
     def get_entity_state(self, entity_key: str) -> Any:
         """Get the current state for an entity."""
+        optimistic = self._optimistic
+        if optimistic and entity_key in optimistic:
+            return optimistic[entity_key]
+        resolver = self._state_resolvers.get(entity_key)
+        if resolver is None:
+            return None
+        return resolver()
+
+    def _get_derived_state(self, entity_key: str, compute: Callable[[], Any]) -> Any:
+        """Return a derived value, computing it only after its inputs changed."""
+        try:
+            return self._derived_state[entity_key]
+        except KeyError:
+            value = self._derived_state[entity_key] = compute()
+            return value
+
+    def _get_temperature_target(self) -> float | None:
+        """Return the requested target, which may be fractional."""
+        if self.temperature_target_requested is not None:
+            return self.temperature_target_requested
+        return self.settings_data.temperature_target
+
+    def _compute_controller_temp(self) -> float | None:
+        """Return the temperature the heater regulates on."""
+        sensor = self.settings_data.sensor
+        if sensor == 1:
+            board_temp = self.status_data.board_temp
+            return float(board_temp) if board_temp is not None else None
+        if self.external_temperature_current is not None:
+            return self.external_temperature_current
 
-        if entity_key == "temperature_target":
-            if self.temperature_target_requested is not None:
-                return self.temperature_target_requested
-            return self.settings_data.get("temperature_target")
-        if entity_key in self.status_data:
-            return self.status_data[entity_key]
-        elif entity_key in self.settings_data:
-            return self.settings_data[entity_key]
-        elif entity_key == "controller_temp":
-            sensor = self.settings_data.get("sensor")
-            if sensor == 1:
-                board_temp = self.status_data.get("board_temp")
-                return float(board_temp) if board_temp is not None else None
-            if self.external_temperature_current is not None:
-                return self.external_temperature_current
-
-            compensation = self._get_target_temperature_compensation()
-            return round(float(self.temperature_data) - compensation, 1)
-        elif entity_key == "control":
-            if self.status_data["status_code"] == "3.35":
-                return "fan_only"
-            elif self.status_data["status_code"] == "0.1":
-                return "off"
-            else:
-                return "heat"
-            # return self.control
-
-        # # Temperature entities
-        # if entity_key == "temperature_intake" and "boardTemp" in self.status_data:
-        #     value = self.status_data["boardTemp"]
-        #     return value > 127 and value - 255 or value
-        # elif entity_key == "temperature_sensor" and "externalTemp" in self.status_data:
-        #     return self.status_data["externalTemp"]
-        # elif entity_key == "temperature_heat_exchanger" and "temperatureHeatExchanger" in self.status_data:
-        #     return self.status_data["temperatureHeatExchanger"]
-        # elif entity_key == "temperature_panel" and "value" in self.temperature_data:
-        #     return self.temperature_data["value"]
-        # elif entity_key == "temperature_target" and "targetTemperature" in self.settings_data:
-        #     return self.settings_data["targetTemperature"]
-
-        # # Status entities
-        # elif entity_key == "status_code" and "statusCode" in self.status_data:
-        #     return self.status_data["statusCode"]
-        # elif entity_key == "status" and "status" in self.status_data:
-        #     return self.status_data["status"]
-
-        # # Diagnostic entities
-        # elif entity_key == "voltage" and "voltage" in self.status_data:
-        #     return self.status_data["voltage"]
-        # elif entity_key == "fan_rpm_specified" and "fanRpmSpecified" in self.status_data:
-        #     return self.status_data["fanRpmSpecified"]
-        # elif entity_key == "fan_rpm_actual" and "fanRpmActual" in self.status_data:
-        #     return self.status_data["fanRpmActual"]
-        # elif entity_key == "frequency_fuel_pump" and "frequencyFuelPump" in self.status_data:
-        #     return self.status_data["frequencyFuelPump"]
-        # elif entity_key == "blackbox_version" and self.version:
-        #     return self.version
-
-        # # Control entities
-        # elif entity_key == "control" and "control" in self.status_data:
-        #     control_key = self.status_data["control"]
-        #     return CONTROL_OPTIONS.get(control_key, "Unknown")
-        # elif entity_key == "level" and "level" in self.settings_data:
-        #     level_key = self.settings_data["level"]
-        #     return LEVEL_OPTIONS.get(level_key, "Unknown")
-        # elif entity_key == "power" and "level" in self.settings_data:
-        #     return self.settings_data["level"] + 1
-        # elif entity_key == "work_time" and "workTime" in self.settings_data:
-        #     return self.settings_data["workTime"]
-        # elif entity_key == "sensor" and "sensor" in self.settings_data:
-        #     sensor_key = self.settings_data["sensor"]
-        #     return SENSOR_OPTIONS.get(sensor_key, "Unknown")
-        # elif entity_key == "mode" and "mode" in self.settings_data:
-        #     mode_key = self.settings_data["mode"]
-        #     return MODE_OPTIONS.get(mode_key, "Unknown")
-
-        return None
-
-    async def send_message(self, key: str, payload: bytes = b"") -> None:
-        """Send a message to the device."""
-        if not self.serial:
-            raise Exception("Not connected to device")
+        compensation = self._get_target_temperature_compensation()
+        return round(float(self.temperature_data) - compensation, 1)
+
+    def _compute_control(self) -> str | None:
+        """Return the control mode reported by the heater."""
+        status_code = self.status_data.status_code
+        if status_code is None:
+            return None
+        if status_code == "3.35":
+            return "fan_only"
+        elif status_code == "0.1":
+            return "off"
+        else:
+            return "heat"
+
+    async def send_message(
+        self,
+        key: str,
+        payload: bytes = b"",
+        expect_response: bool = False,
+        priority: int = PRIORITY_CONTROL,
+    ) -> asyncio.Future | None:
+        """Queue a message for the writer task and wait until it is written.
+
+        With expect_response the returned future resolves to the payload of
+        the first response carrying the same message ID after the frame went
+        out. Frames queued at PRIORITY_POLL collapse with an identical poll
+        that is still waiting in the queue.
+        """
+        if not self.transport:
+            raise ConnectionError("Not connected to device")
+
+        message_id = MESSAGE_IDS_REV.get(key)
+        if message_id is None:
+            raise ValueError(f"Unknown message key: {key}")
 
         _LOGGER.debug(f"Sending message: {key} ({payload.hex()})")
-        async with self._writer_lock:
-            try:
-                message_id = MESSAGE_IDS_REV.get(key)
-                if message_id is None:
-                    raise ValueError(f"Unknown message key: {key}")
+        response = self.loop.create_future() if expect_response else None
+
+        poll_key = (key, payload) if priority == PRIORITY_POLL else None
+        frame = self._queued_polls.get(poll_key) if poll_key else None
+        if frame is None:
+            frame = _OutgoingFrame(key, message_id, build_frame(message_id, payload))
+            if poll_key:
+                self._queued_polls[poll_key] = frame
+            self._write_sequence += 1
+            self._write_queue.put_nowait((priority, self._write_sequence, frame))
+        if response is not None:
+            frame.responses.append(response)
+
+        await asyncio.shield(frame.sent)
+        return response
+
+    async def _writer(self) -> None:
+        """Write queued frames in priority order with a fixed frame spacing."""
+        while True:
+            _, _, frame = await self._write_queue.get()
+            poll_key = (frame.key, frame.payload)
+            if self._queued_polls.get(poll_key) is frame:
+                del self._queued_polls[poll_key]
+
+            delay = self._last_write + FRAME_SPACING - self.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if not self.transport:
+                frame.fail(ConnectionError("Not connected to device"))
+                continue
+
+            for response in frame.responses:
+                self._add_pending_response(frame.message_id, response)
+            self.transport.write(frame.data)
+            self.frame_log.record(DIRECTION_TX, frame.data)
+            if self.capture is not None:
+                self._record_capture(DIRECTION_TX, frame.data)
+            self._last_write = self.loop.time()
+            self.latency.request_sent(frame.message_id, frame.key, self._last_write)
+            if not frame.sent.done():
+                frame.sent.set_result(None)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    f"Sent message: {frame.key} full message: {frame.data.hex()}"
+                )
 
-                # Construct header
-                header = bytes([0xAA, 0x03, len(payload), 0x00, message_id])
+    @callback
+    def _fail_queued_frames(self, exc: Exception) -> None:
+        """Fail every frame still waiting for the writer."""
+        self._queued_polls.clear()
+        while not self._write_queue.empty():
+            _, _, frame = self._write_queue.get_nowait()
+            frame.fail(exc)
+
+    async def request(
+        self, key: str, payload: bytes = b"", timeout: float = RESPONSE_TIMEOUT
+    ) -> bytes:
+        """Send a message and return the payload of the matching response."""
+        future = await self.send_message(key, payload, expect_response=True)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._response_timed_out(MESSAGE_IDS_REV[key])
+            raise
 
-                # Calculate checksum
-                checksum = self._calc_checksum(header + payload)
+    async def _try_request(self, key: str, payload: bytes = b"") -> bytes | None:
+        """Send a message and wait for its response, logging a timeout."""
+        try:
+            return await self.request(key, payload)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"No response from heater to {key} message")
+            return None
 
-                # Construct full message
-                message = header + payload + checksum
+    @callback
+    def add_command_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever a command is sent; returns a remover."""
+        self._command_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._command_listeners:
+                self._command_listeners.remove(listener)
+
+        return _remove
+
+    async def _send_command(self, key: str, payload: bytes = b"") -> None:
+        """Send a command and refresh the status once the heater replied."""
+        for listener in list(self._command_listeners):
+            listener()
+        await self._try_request(key, payload)
+        await self._try_request("status")
+
+    async def _send_confirmed(
+        self,
+        values: Dict[str, Any],
+        confirmed: Callable[[], bool],
+        send: Callable[[], Awaitable[None]],
+        rollback: Callable[[], None] | None = None,
+    ) -> None:
+        """Show values right away and wait until the heater confirms them.
+
+        The entity keys report the requested values from now on, so entities
+        update before the command is even written. Once a status or settings
+        frame satisfies confirmed the heater's own values take over again.
+        Without confirmation within CONFIRM_TIMEOUT the values are rolled
+        back and CommandNotConfirmed is raised. A newer command for the same
+        keys supersedes this one without an error.
+        """
+        pending = _PendingConfirmation(values, confirmed)
+        for other in list(self._confirmations):
+            if other.values.keys() & values.keys():
+                self._confirmations.remove(other)
+                if not other.future.done():
+                    other.future.set_result(False)
+        self._confirmations.append(pending)
+        self._optimistic.update(values)
+        for key in values:
+            self._notify_state_update(key)
+
+        deadline = self.loop.time() + CONFIRM_TIMEOUT
+        try:
+            await send()
+            if not pending.future.done() and confirmed():
+                pending.future.set_result(True)
+            await asyncio.wait_for(
+                asyncio.shield(pending.future), max(deadline - self.loop.time(), 0)
+            )
+        except (asyncio.TimeoutError, ConnectionError) as ex:
+            if pending.future.done():
+                return
+            if rollback is not None:
+                rollback()
+            raise CommandNotConfirmed(
+                f"Heater did not confirm {', '.join(values)}: {str(ex) or 'timeout'}"
+            ) from ex
+        finally:
+            if pending in self._confirmations:
+                self._confirmations.remove(pending)
+            if not pending.future.done():
+                pending.future.set_result(False)
+            # Keys taken over by a newer command keep its values
+            for key, value in values.items():
+                if key in self._optimistic and not any(
+                    key in other.values for other in self._confirmations
+                ):
+                    del self._optimistic[key]
+                    self._derived_state.pop(key, None)
+                    self._notify_state_update(key)
 
-                # Send message
-                await self.loop.run_in_executor(None, self.serial.write, message)
+    @callback
+    def _check_confirmations(self) -> None:
+        """Resolve the confirmations the latest frame satisfies."""
+        for pending in list(self._confirmations):
+            if pending.confirmed():
+                self._confirmations.remove(pending)
+                if not pending.future.done():
+                    pending.future.set_result(True)
+
+    def _restore_settings(self) -> None:
+        """Drop local settings changes the heater did not take."""
+        if self._last_settings_payload is not None:
+            self.settings = self._last_settings_payload
 
-                # Wait for a moment to ensure the message is sent
-                await asyncio.sleep(0.1)
+    @callback
+    def _response_timed_out(self, message_id: int) -> None:
+        """Account for a request the heater did not answer in time."""
+        self.latency.request_timed_out(message_id)
+        self._schedule_latency_report()
+        self.supervisor.response_timed_out()
 
-                _LOGGER.debug(
-                    f"Sent message: {key} ({payload.hex()}) full message: {message.hex()}"
-                )
+    @callback
+    def _schedule_latency_report(self) -> None:
+        """Update the latency sensors at most once per LATENCY_REPORT_INTERVAL."""
+        if self._latency_report is None:
+            self._latency_report = self.loop.call_later(
+                LATENCY_REPORT_INTERVAL, self._report_latency
+            )
 
-                return True
-            except Exception as ex:
-                _LOGGER.error(f"Error sending message: {ex}")
-                raise
+    @callback
+    def _report_latency(self) -> None:
+        """Notify the latency sensors."""
+        self._latency_report = None
+        for key in ("latency_p50", "latency_p95", "latency_p99", "response_timeouts"):
+            self._notify_state_update(key)
+
+    async def poll(self) -> None:
+        """Queue routine status and settings polls behind pending commands.
+
+        The status response is not awaited, but a missing one still counts
+        towards dead port detection.
+        """
+        response = await self.send_message(
+            "status", expect_response=True, priority=PRIORITY_POLL
+        )
+        self._watch_response(response, MESSAGE_IDS_REV["status"])
+        await self.send_message("settings", priority=PRIORITY_POLL)
 
-    def _calc_checksum(self, data: bytes) -> bytes:
-        """Calculate the checksum for a message."""
-        crc = 0xFFFF
+    @callback
+    def _watch_response(
+        self, future: asyncio.Future, message_id: int, timeout: float = RESPONSE_TIMEOUT
+    ) -> None:
+        """Report a response that does not arrive within timeout."""
+
+        @callback
+        def _expire() -> None:
+            if not future.done():
+                future.cancel()
+                self._response_timed_out(message_id)
+
+        @callback
+        def _done(done: asyncio.Future) -> None:
+            handle.cancel()
+            # Nobody awaits the future, so retrieve a connection error here.
+            if not done.cancelled():
+                done.exception()
+
+        handle = self.loop.call_later(timeout, _expire)
+        future.add_done_callback(_done)
+
+    def _add_pending_response(
+        self, message_id: int, future: asyncio.Future
+    ) -> None:
+        """Register a future for the next response with message_id."""
+        if future.done():
+            return
+        waiters = self._pending_responses.setdefault(message_id, [])
+        waiters.append(future)
 
-        for byte in data:
-            crc = crc ^ byte
+        def _discard(done: asyncio.Future) -> None:
+            if done in waiters:
+                waiters.remove(done)
 
-            for _ in range(8):
-                odd = crc & 0x0001
-                crc >>= 1
+        future.add_done_callback(_discard)
 
-                if odd:
-                    crc ^= 0xA001
+    @callback
+    def _resolve_pending_response(self, message_id: int, payload: bytes) -> None:
+        """Resolve every future waiting for a response with message_id."""
+        waiters = self._pending_responses.get(message_id)
+        if not waiters:
+            return
+        for future in list(waiters):
+            if not future.done():
+                future.set_result(payload)
 
-        return bytes([(crc >> 8) & 0xFF, crc & 0xFF])
+    @callback
+    def _fail_pending_responses(self, exc: Exception) -> None:
+        """Fail every outstanding response future."""
+        for waiters in self._pending_responses.values():
+            for future in list(waiters):
+                if not future.done():
+                    future.set_exception(exc)
+
+    @callback
+    def process_message(self, buffer: bytes | memoryview) -> None:
+        """Process a message from the device.
 
-    async def process_message(self, buffer: bytes) -> None:
-        """Process a message from the device."""
+        The buffer may be a view into the parser's receive buffer, so nothing
+        derived from it may be kept without copying.
+        """
+        self.frame_log.record(DIRECTION_RX, buffer)
         if len(buffer) < 5:
             _LOGGER.error("Buffer too short")
             return
@@ -286,10 +712,9 @@ class AutotermDevice:
             type_str = MESSAGE_TYPES.get(type_value, f"Unknown ({type_value})")
             length = buffer[2]
             payload = buffer[5 : 5 + length]
-            checksum = buffer[5 + length :]
             # Verify checksum and discard corrupted frames.
-            if checksum != self._calc_checksum(buffer[: 5 + length]):
-                _LOGGER.error(f"Checksum error in message: {buffer.hex()}")
+            if len(buffer) != 5 + length + 2 or not verify_checksum(buffer):
+                _LOGGER.error(f"Checksum error in message: {bytes(buffer).hex()}")
                 return
 
             if type_str in ["request", "response"]:
@@ -301,21 +726,31 @@ class AutotermDevice:
             else:
                 id_str = f"Unknown ({buffer[4]})"
 
-            _LOGGER.debug(f"Received message: {type_str} {id_str} ({payload.hex()})")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    f"Received message: {type_str} {id_str} ({payload.hex()})"
+                )
 
             if type_str == "response":
+                self.latency.response_received(id_value, self.loop.time())
+                self._schedule_latency_report()
+                self.supervisor.response_received()
                 if id_str == "version":
-                    await self._process_version_message(payload)
+                    self._process_version_message(payload)
                 elif id_str == "status":
-                    await self._process_status_message(payload)
+                    self._process_status_message(payload)
                 elif id_str == "settings":
-                    await self._process_settings_message(payload)
+                    self._process_settings_message(payload)
                 elif id_str == "temperature":
-                    await self._process_temperature_message(payload)
+                    self._process_temperature_message(payload)
+                self._resolve_pending_response(id_value, bytes(payload))
+                if self._confirmations:
+                    self._check_confirmations()
         except Exception as ex:
             _LOGGER.error(f"Error processing message: {ex}")
 
-    async def _process_version_message(self, buffer: bytes) -> None:
+    @callback
+    def _process_version_message(self, buffer: bytes | memoryview) -> None:
         """Process a version message."""
         if len(buffer) < 5:
             return
@@ -326,106 +761,140 @@ class AutotermDevice:
         self._notify_state_update("blackbox_version")
         _LOGGER.info(f"Connected to Autoterm heater with version: {self.version}")
 
-    async def _process_status_message(self, buffer: bytes) -> None:
+    @callback
+    def _process_status_message(self, buffer: bytes | memoryview) -> None:
         """Process a status message."""
         try:
-            if len(buffer) < 19:
+            if len(buffer) < STATUS_CODEC.size:
                 raise ValueError("Buffer too short")
-            # 0300001b7f008201c704002d2d005000500064
-            # ssssErBtEtM0VtFlamM1M2FsFaM3Fp
-
-            self.status_data = {
-                "status_code": f"{buffer[0]}.{buffer[1]}",
-                "error_code": buffer[2],
-                "board_temp": buffer[3],
-                # signed byte
-                "external_temp": buffer[4] > 127 and buffer[4] - 255 or buffer[4],
-                "mystery0": buffer[5],
-                "voltage": buffer[6] / 10,
-                "flame_temperature": int.from_bytes(buffer[7:9], "big"),
-                "mystery1": buffer[9],
-                "mystery2": buffer[10],
-                "fan_rpm_specified": buffer[11] * 60,
-                "fan_rpm_actual": buffer[12] * 60,
-                "mystery3": buffer[13],
-                "frequency_fuel_pump": buffer[14] / 100,
-                "mystery4": buffer[15],
-                "frequency_fuel_pump_actual": buffer[16] / 100,
-                "glow_plug_current": buffer[17] / 10,
-                "mystery5": buffer[18],
-                "status_length": len(buffer),
-            }
-
-            # Add status text
-            self.status_data["status"] = STATUS_OPTIONS.get(
-                self.status_data["status_code"], "unknown"
-            )
+            # Identical frames are the common case while polling.
+            if buffer == self._last_status_payload:
+                self._integrate_consumption()
+                return
+            self._last_status_payload = bytes(buffer)
 
-            # notify state update for every entry in the status_data
-            for key in self.status_data:
+            changed = STATUS_CODEC.decode_into(self.status_data, buffer)
+            for key in changed:
                 self._notify_state_update(key)
-            self._notify_state_update("controller_temp")
+            self._integrate_consumption()
 
-            _LOGGER.debug(f"Status: {self.status_data}")
+            _LOGGER.debug("Status: %s", self.status_data)
 
         except Exception as ex:
             _LOGGER.error(f"{ERROR_PROCESS_STATUS_MESSAGE}{ex}")
 
-    async def _process_settings_message(self, buffer: bytes) -> None:
+    @callback
+    def _integrate_consumption(self) -> None:
+        """Integrate the fuel pump up to this status frame."""
+        if self.consumption.hold(
+            self.status_data.frequency_fuel_pump_actual, self.loop.time()
+        ):
+            self._notify_state_update("fuel_consumed")
+            self._notify_state_update("burner_runtime")
+
+    @callback
+    def _process_settings_message(self, buffer: bytes | memoryview) -> None:
         """Process a settings message."""
         try:
-            if len(buffer) < 6:
+            if len(buffer) < SETTINGS_CODEC.size:
                 raise ValueError("Buffer too short")
 
-            self.settings = buffer
-
-            self.settings_data = {
-                "work_time": (buffer[0] << 8 | buffer[1]),
-                "sensor": buffer[2],
-                "temperature_target": buffer[3],
-                "mode": buffer[4],
-                "level": buffer[5],
-                "power": (buffer[5] + 1) * 10,
-            }
+            changed = set()
+            if buffer != self._last_settings_payload:
+                self._last_settings_payload = bytes(buffer)
+                self.settings = self._last_settings_payload
+                changed = SETTINGS_CODEC.decode_into(self.settings_data, buffer)
 
             heater_target = self.settings_data["temperature_target"]
-            if self.temperature_target_requested is None:
+            requested_target = self.temperature_target_requested
+            if requested_target is None:
                 self.temperature_target_requested = float(heater_target)
             else:
-                expected_target = self._round_for_heater(
-                    self.temperature_target_requested
-                )
+                expected_target = self._round_for_heater(requested_target)
                 if expected_target != heater_target:
                     self.temperature_target_requested = float(heater_target)
+            if self.temperature_target_requested != requested_target:
+                changed.add("temperature_target")
 
-            for key in self.settings_data:
+            for key in changed:
                 self._notify_state_update(key)
 
-            _LOGGER.debug(f"Settings: {self.settings_data}")
+            _LOGGER.debug("Settings: %s", self.settings_data)
         except Exception as ex:
             _LOGGER.error(f"{ERROR_PROCESS_SETTINGS_MESSAGE}{ex}")
 
-    async def _process_temperature_message(self, buffer: bytes) -> None:
+    @callback
+    def _process_temperature_message(self, buffer: bytes | memoryview) -> None:
         """Process a temperature message."""
         try:
             if len(buffer) < 1:
                 raise ValueError("Buffer too short")
+            if buffer == self._last_temperature_payload:
+                return
+            self._last_temperature_payload = bytes(buffer)
 
             self.temperature_data = buffer[0]
 
             # Notify entities of state changes
             self._notify_state_update("temperature_panel")
-            self._notify_state_update("controller_temp")
 
             _LOGGER.debug(f"Temperature: {self.temperature_data}")
 
         except Exception as ex:
             _LOGGER.error(f"{ERROR_PROCESS_TEMPERATURE_MESSAGE}{ex}")
 
+    @callback
+    def async_add_listener(
+        self, entity_keys: Iterable[str], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call update_callback once per update touching any of entity_keys.
+
+        Every listener is also called when the connection state changes, so
+        entities can update their availability.
+        """
+        entity_keys = tuple(dict.fromkeys((*entity_keys, "connection_state")))
+        for entity_key in entity_keys:
+            self._update_listeners.setdefault(entity_key, []).append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            for entity_key in entity_keys:
+                listeners = self._update_listeners.get(entity_key)
+                if listeners and update_callback in listeners:
+                    listeners.remove(update_callback)
+
+        return _remove
+
     def _notify_state_update(self, entity_key: str) -> None:
-        """Notify an entity of a state update."""
-        signal = SIGNAL_STATE_UPDATED.format(f"{self.entry_id}_{entity_key}")
-        async_dispatcher_send(self.hass, signal)
+        """Mark an entity key as changed.
+
+        Changes are collected and flushed once per event loop iteration, so
+        a decoded frame produces a single update in which every listener is
+        called at most once.
+        """
+        self._pending_updates.add(entity_key)
+        self._derived_state.pop(entity_key, None)
+        for derived_key in DERIVED_KEYS_BY_INPUT.get(entity_key, ()):
+            self._derived_state.pop(derived_key, None)
+            self._pending_updates.add(derived_key)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.loop.call_soon(self._flush_state_updates)
+
+    @callback
+    def _flush_state_updates(self) -> None:
+        """Call every listener subscribed to one of the changed keys."""
+        self._flush_scheduled = False
+        changed = self._pending_updates
+        self._pending_updates = set()
+
+        listeners = self._update_listeners
+        update_callbacks = {}
+        for entity_key in changed:
+            for update_callback in listeners.get(entity_key, ()):
+                update_callbacks[update_callback] = None
+        for update_callback in update_callbacks:
+            update_callback()
 
     # ---- Control methods ----
 
@@ -446,31 +915,101 @@ class AutotermDevice:
         heater_target = self._round_for_heater(self.temperature_target_requested)
         return heater_target - self.temperature_target_requested
 
+    def _get_heater_temperature(self, value: float) -> int:
+        """Return the integer temperature to report for an external reading."""
+        target = self.temperature_target_requested
+        if target is None:
+            return self._clamp_heater_temperature(math.floor(value))
+        return self._clamp_heater_temperature(
+            reported_temperature(
+                value, target, self._round_for_heater(target), self.controller
+            )
+        )
+
+    @callback
+    def start_control_loop(self, controller: Controller, interval: float) -> None:
+        """Choose the reported temperature with a controller every interval."""
+        self.stop_control_loop()
+        self.controller = controller
+        self._control_interval = interval
+        self._control_last = None
+        self._control_timer = self.loop.call_later(interval, self._control_tick)
+
+    @callback
+    def stop_control_loop(self) -> None:
+        """Return to the static compensation."""
+        if self._control_timer is not None:
+            self._control_timer.cancel()
+            self._control_timer = None
+        self.controller = None
+
+    @callback
+    def _control_tick(self) -> None:
+        """Advance the controller and report the resulting temperature."""
+        self._control_timer = self.loop.call_later(
+            self._control_interval, self._control_tick
+        )
+        value = self.external_temperature_current
+        target = self.temperature_target_requested
+        if value is None or target is None:
+            return
+        now = self.loop.time()
+        elapsed = 0.0 if self._control_last is None else now - self._control_last
+        self._control_last = now
+        # Only integrate while the heater is actually regulating
+        if self.status_data.status_code == "3.0":
+            self.controller.update(target - value, elapsed)
+        else:
+            self.controller.reset()
+        self.loop.create_task(self._async_control_step())
+
+    async def _async_control_step(self) -> None:
+        """Send the controlled temperature if it changed."""
+        try:
+            await self.submit_cached_external_temperature()
+        except ConnectionError as ex:
+            _LOGGER.debug(f"Control step skipped: {ex}")
+
     async def set_temperature_current(self, value: int) -> None:
         """Set the current temperature."""
         heater_value = self._clamp_heater_temperature(int(value))
-        await self.send_message("temperature", bytes([heater_value]))
+        self._last_submitted_temperature = heater_value
+        self._last_temperature_submit = self.loop.time()
+        await self.send_message(
+            "temperature", bytes([heater_value]), priority=PRIORITY_TEMPERATURE
+        )
 
-    async def submit_external_temperature(self, value: float) -> None:
-        """Submit external temperature with compensation for fractional targets."""
+    def seconds_since_temperature_submit(self) -> float:
+        """Return the seconds since a temperature frame was last sent."""
+        if self._last_temperature_submit is None:
+            return math.inf
+        return self.loop.time() - self._last_temperature_submit
+
+    async def submit_external_temperature(
+        self, value: float, force: bool = False
+    ) -> None:
+        """Submit external temperature with compensation for fractional targets.
+
+        Nothing is sent unless the compensated heater value changed or force
+        is set.
+        """
         self.external_temperature_current = round(value, 1)
-        compensation = self._get_target_temperature_compensation()
-        compensated_value = value + compensation
-        heater_value = self._clamp_heater_temperature(math.floor(compensated_value))
+        heater_value = self._get_heater_temperature(value)
+        self._notify_state_update("controller_temp")
+        if not force and heater_value == self._last_submitted_temperature:
+            return
         _LOGGER.debug(
-            "Submitting external temperature %.2f°C (compensation %.2f -> %d)",
-            value,
-            compensation,
-            heater_value,
+            "Submitting external temperature %.2f°C as %d", value, heater_value
         )
         await self.set_temperature_current(heater_value)
-        self._notify_state_update("controller_temp")
 
-    async def submit_cached_external_temperature(self) -> bool:
+    async def submit_cached_external_temperature(self, force: bool = False) -> bool:
         """Resubmit the last known external temperature if available."""
         if self.external_temperature_current is None:
             return False
-        await self.submit_external_temperature(self.external_temperature_current)
+        await self.submit_external_temperature(
+            self.external_temperature_current, force=force
+        )
         return True
 
     def set_external_temperature_current(self, value: float | None) -> None:
@@ -484,79 +1023,92 @@ class AutotermDevice:
         """Return cached external temperature used for fallback submissions."""
         return self.external_temperature_current
         
+    async def _require_settings(self) -> None:
+        """Make sure the heater settings are known before changing them.
+
+        The settings frame of the handshake may have timed out; it is then
+        requested again, and CommandNotConfirmed is raised if it still does
+        not arrive.
+        """
+        if self.settings is not None:
+            return
+        try:
+            await self._try_request("settings")
+        except ConnectionError as ex:
+            raise CommandNotConfirmed(f"Heater settings unknown: {ex}") from ex
+        if self.settings is None:
+            raise CommandNotConfirmed("Heater settings unknown: no response")
+
+    def _update_settings(self, **values: int) -> None:
+        """Pack new values into the settings payload sent to the heater."""
+        self.settings = SETTINGS_CODEC.encode(values, self.settings)
+
     def set_work_time_indefinite(self) -> None:
         """Set the work time to indefinite."""
-        self.settings = bytearray(self.settings)
-        self.settings[0] = 0xFF
-        self.settings[1] = 0xFF
+        self._update_settings(work_time=0xFFFF)
 
     async def set_work_time(self, value: int) -> None:
         """Set the work time in Hours."""
         if False:  # value > 0: #always run indefinitely
             # minimum 30 minutes
             value_minutes = max(30, value)
-            self.settings = bytearray(self.settings)
-            self.settings[0] = value_minutes >> 8
-            self.settings[1] = value_minutes & 0xFF
+            self._update_settings(work_time=value_minutes)
         else:
+            await self._require_settings()
             self.set_work_time_indefinite()
 
-        await self.send_message("settings", bytes(self.settings))
-
-        await asyncio.sleep(0.5)
-        await self.send_message("status")
+        await self._send_command("settings", self.settings)
 
     async def set_sensor(self, key: int) -> None:
         """Set the temperature sensor."""
         _LOGGER.debug(f"Setting sensor to {key}")
         if SENSOR_OPTIONS.get(key) is not None:
-            self.settings = bytearray(self.settings)
-            self.settings[2] = key
+            await self._require_settings()
+            mode = SETTINGS_CODEC.decode(self.settings).mode
             if key == 0x04:  # if set to manual
-                self.settings[4] = 0x02
+                mode = 0x02
             else:
-                if self.settings[4] == 0x02:
-                    self.settings[4] = 0x03
-
-            self._notify_state_update("sensor")
-            self._notify_state_update("mode")
-            await self.send_message("settings", bytes(self.settings))
-
-            await asyncio.sleep(0.5)
-            await self.send_message("status")
+                if mode == 0x02:
+                    mode = 0x03
+            self._update_settings(sensor=key, mode=mode)
+            await self._send_settings_confirmed(sensor=key, mode=mode)
             return
 
     async def set_temperature_target(self, value: float) -> None:
         """Set the target temperature."""
+        await self._require_settings()
         requested_target = max(0.0, min(30.0, float(value)))
         heater_target = self._round_for_heater(requested_target)
+        previous_target = self.temperature_target_requested
         self.temperature_target_requested = round(requested_target, 1)
-        self.settings = bytearray(self.settings)
-        self.settings[3] = heater_target
-        self._notify_state_update("temperature_target")
-        await self.send_message("settings", bytes(self.settings))
+        self._update_settings(temperature_target=heater_target)
 
-        await asyncio.sleep(0.5)
-        await self.send_message("status")
+        def _rollback() -> None:
+            self._restore_settings()
+            self.temperature_target_requested = previous_target
+
+        await self._send_confirmed(
+            {"temperature_target": self.temperature_target_requested},
+            lambda: self.settings_data.temperature_target == heater_target,
+            partial(self._send_command, "settings", self.settings),
+            _rollback,
+        )
+        # The compensation for fractional targets changed with the target
+        await self.submit_cached_external_temperature()
 
     async def set_mode(self, key: int) -> None:
         """Set the operation mode."""
         _LOGGER.debug(f"Setting mode to {key}")
         if MODE_OPTIONS.get(key) is not None:
-            self.settings = bytearray(self.settings)
-            self.settings[4] = key
-
+            await self._require_settings()
+            sensor = SETTINGS_CODEC.decode(self.settings).sensor
             if key == 0x02:  # stufenregelung -> manual sensor
-                self.settings[2] = 0x04
+                sensor = 0x04
             else:
-                if self.settings[2] == 0x04:
-                    self.settings[2] = 0x02
-
-            self._notify_state_update("mode")
-            self._notify_state_update("sensor")
-            await self.send_message("settings", bytes(self.settings))
-            await asyncio.sleep(0.5)
-            await self.send_message("status")
+                if sensor == 0x04:
+                    sensor = 0x02
+            self._update_settings(mode=key, sensor=sensor)
+            await self._send_settings_confirmed(mode=key, sensor=sensor)
             return
 
     async def set_power(self, value: int) -> None:
@@ -566,35 +1118,71 @@ class AutotermDevice:
     async def set_level(self, value: int) -> None:
         """Set the level 0-9."""
         if 0 <= value <= 9:
-            self.settings = bytearray(self.settings)
-            self.settings[5] = value
-
-            self._notify_state_update("power")
-            self._notify_state_update("level")
+            await self._require_settings()
+            self._update_settings(level=value)
+            await self._send_settings_confirmed(
+                {"power": (value + 1) * 10}, level=value
+            )
 
-            await self.send_message("settings", bytes(self.settings))
-            await asyncio.sleep(0.5)
-            await self.send_message("status")
+    async def _send_settings_confirmed(
+        self, derived: Dict[str, Any] | None = None, **values: int
+    ) -> None:
+        """Write the settings and wait until the heater reports the values."""
+        settings_data = self.settings_data
+        await self._send_confirmed(
+            {**values, **(derived or {})},
+            lambda: all(settings_data[key] == value for key, value in values.items()),
+            partial(self._send_command, "settings", self.settings),
+            self._restore_settings,
+        )
 
     async def set_control(self, key: str) -> None:
         """Set the control mode (off, heat, fan_only)."""
+        # Turning off must not depend on the settings being known
+        if key in ("heat", "fan_only"):
+            await self._require_settings()
 
         self.control = key
-        self.set_work_time_indefinite()
+        if self.settings is not None:
+            self.set_work_time_indefinite()
 
         if key == "off":
-            await self.send_message("off")
+            send = partial(self._send_command, "off")
         elif key == "fan_only":
-            await self.send_message(
-                "fan_only", bytes([0x00, 0x00, self.settings[5], 0xFF])
+            send = partial(
+                self._send_command,
+                "fan_only",
+                bytes([0x00, 0x00, SETTINGS_CODEC.decode(self.settings).level, 0xFF]),
             )
         elif key == "heat":
-            await self.send_message("heat", bytes(self.settings))
-        self._notify_state_update("control")
+            send = partial(self._send_command, "heat", self.settings)
+        else:
+            return
+        await self._send_confirmed(
+            {"control": key},
+            partial(self._control_confirmed, key),
+            send,
+        )
 
-        await asyncio.sleep(0.5)
-        await self.send_message("status")
-        return
+    def _control_confirmed(self, key: str) -> bool:
+        """Return True once the status shows the heater following a control."""
+        status_code = self.status_data.status_code
+        if status_code is None:
+            return False
+        if key == "off":
+            # Off is confirmed by the shutdown and cool-down as well as by standby
+            return (
+                status_code in ("0.1", "3.4")
+                or status_code.startswith("1")
+                or status_code.startswith("4")
+            )
+        if key == "heat":
+            # A cool-down from an earlier off still reads as heat, so it does
+            # not confirm; heating, monitoring and overheat protection do
+            return status_code.startswith("2") or (
+                status_code.startswith("3") and status_code not in ("3.4", "3.35")
+            )
+        return self._compute_control() == key
 
     async def set_external_temperature_sensor(self, key: str | None) -> None:
         """Set the external temperature sensor."""
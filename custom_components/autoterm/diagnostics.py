@@ -0,0 +1,60 @@
+"""Diagnostics support for Autoterm."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_SERIAL_PORT, DOMAIN
+from .device import AutotermDevice
+
+# The port of a network bridge contains its host
+TO_REDACT = {CONF_SERIAL_PORT}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device: AutotermDevice = hass.data[DOMAIN][entry.entry_id]
+    supervisor = device.supervisor
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "version": device.version,
+        "status_data": device.status_data.as_dict(),
+        "settings_data": device.settings_data.as_dict(),
+        "settings": device.settings.hex() if device.settings else None,
+        "temperature_data": device.temperature_data,
+        "external_temperature": {
+            "sensor": device.get_external_temperature_sensor(),
+            "current": device.get_external_temperature_current(),
+        },
+        "connection": {
+            "state": supervisor.state,
+            "reconnects": supervisor.reconnects,
+            "connection_failures": supervisor.connection_failures,
+            "parser": device.parser.stats,
+        },
+        "latency": {
+            "p50": device.latency.percentile_ms(50),
+            "p95": device.latency.percentile_ms(95),
+            "p99": device.latency.percentile_ms(99),
+            "timeouts": device.latency.timeouts,
+            "messages": device.latency.as_attributes(),
+        },
+        "control": (
+            None
+            if device.controller is None
+            else {"type": type(device.controller).__name__, **vars(device.controller)}
+        ),
+        "frames": {
+            "recorded": device.frame_log.recorded,
+            "capacity": device.frame_log.capacity,
+            "log": device.frame_log.snapshot(),
+        },
+    }
@@ -0,0 +1,170 @@
+"""Forward the selected external temperature sensor to the heater."""
+
+import logging
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .device import AutotermDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ExternalTemperatureForwarder:
+    """Push the selected sensor's temperature to the heater when it changes.
+
+    Every state change of the selected entity is forwarded. The device only
+    writes a temperature frame when the compensated integer value changes.
+    A keepalive resends the last value whenever nothing has been sent for
+    ``keepalive`` seconds, so the heater does not fall back to its own
+    sensor. The keepalive is timed from the last temperature frame, which
+    may also have been sent by the device itself.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, device: AutotermDevice, keepalive: float
+    ) -> None:
+        """Initialize the forwarder."""
+        self._hass = hass
+        self._device = device
+        self._keepalive = keepalive
+        self._entity_id: str | None = None
+        self._remove_state_listener: CALLBACK_TYPE | None = None
+        self._remove_listeners: list[CALLBACK_TYPE] = []
+        self._cancel_keepalive: CALLBACK_TYPE | None = None
+        self._running = False
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start forwarding; returns a callback that stops it."""
+        self._running = True
+        self._remove_listeners = [
+            self._device.async_add_listener(
+                ("external_temperature_sensor",), self._async_sensor_selected
+            ),
+        ]
+        self._async_schedule_keepalive()
+        self._async_sensor_selected()
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop forwarding."""
+        self._running = False
+        for remove in self._remove_listeners:
+            remove()
+        self._remove_listeners = []
+        if self._cancel_keepalive:
+            self._cancel_keepalive()
+            self._cancel_keepalive = None
+        if self._remove_state_listener:
+            self._remove_state_listener()
+            self._remove_state_listener = None
+        self._entity_id = None
+
+    @callback
+    def _async_sensor_selected(self) -> None:
+        """Follow the sensor selected on the device."""
+        entity_id = self._device.get_external_temperature_sensor()
+        if entity_id == self._entity_id:
+            return
+
+        if self._remove_state_listener:
+            self._remove_state_listener()
+            self._remove_state_listener = None
+        self._entity_id = entity_id
+        if not entity_id:
+            return
+
+        self._remove_state_listener = async_track_state_change_event(
+            self._hass, [entity_id], self._async_state_changed
+        )
+        self._hass.async_create_task(
+            self._async_forward(self._hass.states.get(entity_id))
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Forward a state change of the selected sensor."""
+        self._hass.async_create_task(self._async_forward(event.data.get("new_state")))
+
+    @callback
+    def _async_schedule_keepalive(self) -> None:
+        """Schedule the keepalive for when the last frame is keepalive old."""
+        if not self._running:
+            return
+        delay = self._keepalive - self._device.seconds_since_temperature_submit()
+        if delay <= 0:
+            # Nothing could be sent, e.g. no cached temperature yet
+            delay = self._keepalive
+        self._cancel_keepalive = async_call_later(
+            self._hass, delay, self._async_keepalive
+        )
+
+    async def _async_keepalive(self, now: datetime) -> None:
+        """Resend the last temperature if nothing was sent for a while."""
+        self._cancel_keepalive = None
+        try:
+            if not self._entity_id:
+                return
+            if self._device.seconds_since_temperature_submit() < self._keepalive:
+                return
+            if await self._device.submit_cached_external_temperature(force=True):
+                _LOGGER.debug(
+                    "Resent cached external temperature for %s as keepalive",
+                    self._entity_id,
+                )
+        finally:
+            self._async_schedule_keepalive()
+
+    async def _async_forward(self, temp_state: State | None) -> None:
+        """Submit a sensor state, falling back to the cached temperature."""
+        temp_entity_id = self._entity_id
+        if not temp_state:
+            _LOGGER.debug("Temperature entity %s not found", temp_entity_id)
+            await self._resubmit_cached(temp_entity_id, "sensor entity was not found")
+            return
+
+        if temp_state.state in ("unknown", "unavailable"):
+            _LOGGER.debug(
+                "Temperature entity %s has non-numeric state %s",
+                temp_entity_id,
+                temp_state.state,
+            )
+            await self._resubmit_cached(temp_entity_id, f"state is {temp_state.state}")
+            return
+
+        try:
+            temp_value = float(temp_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Temperature entity %s has invalid numeric value %s",
+                temp_entity_id,
+                temp_state.state,
+            )
+            await self._resubmit_cached(temp_entity_id, "state is not numeric")
+            return
+
+        try:
+            await self._device.submit_external_temperature(temp_value)
+        except Exception as ex:
+            _LOGGER.error(f"Error forwarding external temperature: {ex}")
+            return
+        _LOGGER.debug(
+            "Updated heater with temperature %.2f from %s",
+            temp_value,
+            temp_entity_id,
+        )
+
+    async def _resubmit_cached(self, temp_entity_id: str | None, reason: str) -> None:
+        """Resubmit the last known valid external temperature if available."""
+        try:
+            if await self._device.submit_cached_external_temperature():
+                _LOGGER.debug(
+                    "Resubmitted cached external temperature because %s for %s",
+                    reason,
+                    temp_entity_id,
+                )
+        except Exception as ex:
+            _LOGGER.error(f"Error forwarding external temperature: {ex}")
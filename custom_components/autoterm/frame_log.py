@@ -0,0 +1,72 @@
+"""Always-on ring buffer of the most recent raw frames."""
+
+import time
+from array import array
+from typing import Any, Dict, List
+
+DIRECTION_RX = 0
+DIRECTION_TX = 1
+DIRECTIONS = ("rx", "tx")
+
+DEFAULT_CAPACITY = 256
+# Longest frame kept in full; the status frame is 26 bytes
+SLOT_SIZE = 64
+
+
+class FrameRingBuffer:
+    """Bounded log of raw frames in both directions.
+
+    All storage is allocated up front: one bytearray holding a fixed-size
+    slot per frame plus arrays for timestamps, lengths and directions.
+    Recording copies the frame into the next slot and overwrites the oldest
+    one when full, so it neither allocates nor grows.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, slot_size: int = SLOT_SIZE) -> None:
+        """Allocate the buffer."""
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._data = bytearray(capacity * slot_size)
+        self._view = memoryview(self._data)
+        self._times = array("d", [0.0]) * capacity
+        self._lengths = array("H", [0]) * capacity
+        self._directions = array("B", [0]) * capacity
+        self._next = 0
+        self.recorded = 0
+
+    def record(self, direction: int, frame: bytes | memoryview) -> None:
+        """Store a frame, overwriting the oldest one when full."""
+        index = self._next
+        length = len(frame)
+        stored = length if length < self.slot_size else self.slot_size
+        start = index * self.slot_size
+        self._view[start : start + stored] = frame[:stored]
+        self._times[index] = time.time()
+        self._lengths[index] = length
+        self._directions[index] = direction
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        self.recorded += 1
+
+    def __len__(self) -> int:
+        """Return the number of frames held."""
+        return min(self.recorded, self.capacity)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return the held frames, oldest first."""
+        count = len(self)
+        first = (self._next - count) % self.capacity
+        frames = []
+        for offset in range(count):
+            index = (first + offset) % self.capacity
+            length = self._lengths[index]
+            start = index * self.slot_size
+            stored = min(length, self.slot_size)
+            frames.append(
+                {
+                    "time": self._times[index],
+                    "direction": DIRECTIONS[self._directions[index]],
+                    "length": length,
+                    "data": self._data[start : start + stored].hex(),
+                }
+            )
+        return frames
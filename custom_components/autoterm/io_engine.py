@@ -0,0 +1,184 @@
+"""Shared I/O engine multiplexing all Autoterm serial ports."""
+
+import asyncio
+import logging
+import selectors
+import weakref
+from typing import Callable, Dict, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+FdCallback = Callable[[], None]
+
+EVENT_READ = selectors.EVENT_READ
+EVENT_WRITE = selectors.EVENT_WRITE
+
+_ENGINES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AutotermIOEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class AutotermIOEngine:
+    """Multiplex the file descriptors of many heaters behind one registration.
+
+    All ports are registered with a private epoll (or kqueue) selector and
+    only that selector's descriptor is registered with the event loop. When
+    any port becomes ready the loop wakes the engine once, and the engine
+    dispatches every ready port from a single ``select(0)`` call instead of
+    scheduling one loop callback per port. The transports use the engine
+    through the same add/remove reader/writer calls the loop offers.
+
+    If the platform selector cannot be nested in the loop, or ``multiplex``
+    is False, the engine hands every descriptor to the loop directly.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, multiplex: bool = True
+    ) -> None:
+        """Initialize the engine."""
+        self._loop = loop
+        self._selector: Optional[selectors.BaseSelector] = None
+        if multiplex:
+            selector = selectors.DefaultSelector()
+            if hasattr(selector, "fileno"):
+                self._selector = selector
+            else:
+                selector.close()
+        self._callbacks: Dict[int, List[Optional[FdCallback]]] = {}
+        self._attached = False
+        self.wakeups = 0
+        self.events = 0
+
+    @property
+    def multiplexed(self) -> bool:
+        """Return True if ports share one loop registration."""
+        return self._selector is not None
+
+    @property
+    def ports(self) -> int:
+        """Return the number of registered descriptors."""
+        return len(self._callbacks)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return engine counters."""
+        return {"ports": self.ports, "wakeups": self.wakeups, "events": self.events}
+
+    def add_reader(self, fd: int, callback: FdCallback) -> None:
+        """Call callback whenever fd is readable."""
+        self._set_callback(fd, 0, callback)
+
+    def remove_reader(self, fd: int) -> None:
+        """Stop watching fd for reading."""
+        self._set_callback(fd, 0, None)
+
+    def add_writer(self, fd: int, callback: FdCallback) -> None:
+        """Call callback whenever fd is writable."""
+        self._set_callback(fd, 1, callback)
+
+    def remove_writer(self, fd: int) -> None:
+        """Stop watching fd for writing."""
+        self._set_callback(fd, 1, None)
+
+    def _set_callback(self, fd: int, index: int, callback: Optional[FdCallback]) -> None:
+        """Update the reader (0) or writer (1) callback of fd."""
+        callbacks = self._callbacks.get(fd)
+        if callbacks is None:
+            if callback is None:
+                return
+            callbacks = self._callbacks[fd] = [None, None]
+        callbacks[index] = callback
+
+        if self._selector is None:
+            self._set_loop_callback(fd, index, callback)
+        else:
+            self._update_selector(fd, callbacks)
+
+        if callbacks == [None, None]:
+            del self._callbacks[fd]
+        self._update_attachment()
+
+    def _set_loop_callback(
+        self, fd: int, index: int, callback: Optional[FdCallback]
+    ) -> None:
+        """Register fd with the loop directly (no multiplexing)."""
+        if index == 0:
+            if callback is None:
+                self._loop.remove_reader(fd)
+            else:
+                self._loop.add_reader(fd, callback)
+        elif callback is None:
+            self._loop.remove_writer(fd)
+        else:
+            self._loop.add_writer(fd, callback)
+
+    def _update_selector(self, fd: int, callbacks: List[Optional[FdCallback]]) -> None:
+        """Sync the private selector with the callbacks of fd."""
+        events = 0
+        if callbacks[0] is not None:
+            events |= EVENT_READ
+        if callbacks[1] is not None:
+            events |= EVENT_WRITE
+        try:
+            key = self._selector.get_key(fd)
+        except KeyError:
+            key = None
+        if key is None:
+            if events:
+                self._selector.register(fd, events, callbacks)
+        elif not events:
+            self._selector.unregister(fd)
+        elif key.events != events:
+            self._selector.modify(fd, events, callbacks)
+
+    def _update_attachment(self) -> None:
+        """Attach the selector to the loop while any port is registered."""
+        if self._selector is None:
+            return
+        if self._callbacks and not self._attached:
+            self._loop.add_reader(self._selector.fileno(), self._process_events)
+            self._attached = True
+        elif not self._callbacks and self._attached:
+            self._loop.remove_reader(self._selector.fileno())
+            self._attached = False
+
+    def _process_events(self) -> None:
+        """Dispatch every ready port."""
+        ready = self._selector.select(0)
+        self.wakeups += 1
+        self.events += len(ready)
+        for key, mask in ready:
+            # A callback may have unregistered this or another port, so the
+            # callbacks are looked up again for every event.
+            callbacks = key.data
+            try:
+                if mask & EVENT_READ and callbacks[0] is not None:
+                    callbacks[0]()
+                if mask & EVENT_WRITE and callbacks[1] is not None:
+                    callbacks[1]()
+            except Exception as ex:  # pylint: disable=broad-except
+                self._loop.call_exception_handler(
+                    {"message": "Exception in Autoterm I/O callback", "exception": ex}
+                )
+
+    def close(self) -> None:
+        """Detach from the loop and release the selector."""
+        for fd in list(self._callbacks):
+            self.remove_reader(fd)
+            self.remove_writer(fd)
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if _ENGINES.get(self._loop) is self:
+            del _ENGINES[self._loop]
+
+
+def get_io_engine(loop: asyncio.AbstractEventLoop) -> AutotermIOEngine:
+    """Return the engine shared by all heaters on loop."""
+    engine = _ENGINES.get(loop)
+    if engine is None:
+        engine = _ENGINES[loop] = AutotermIOEngine(loop)
+        _LOGGER.debug(
+            "Created Autoterm I/O engine (multiplexed: %s)", engine.multiplexed
+        )
+    return engine
@@ -0,0 +1,133 @@
+"""Round-trip latency histograms for heater requests."""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+# Bucket upper bounds in seconds: 1 ms to ~13 s, about 12 % apart
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(0.001 * 1.12**index for index in range(84))
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of latencies with logarithmic buckets.
+
+    Recording is a binary search over the bucket bounds and one counter
+    increment, so it costs the same for every frame. Percentiles are read
+    from the cumulative counts and reported as the bucket's upper bound.
+    """
+
+    __slots__ = ("counts", "count", "timeouts", "maximum")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # The last bucket collects everything above the largest bound
+        self.counts = array("L", [0]) * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.timeouts = 0
+        self.maximum = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one latency."""
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def record_timeout(self) -> None:
+        """Count one request that was never answered."""
+        self.timeouts += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the latency in seconds below which percent of samples fall."""
+        if not self.count:
+            return None
+        threshold = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                if index == len(BUCKET_BOUNDS):
+                    return self.maximum
+                return min(BUCKET_BOUNDS[index], self.maximum)
+        return self.maximum
+
+    def summary(self) -> Dict[str, float | int | None]:
+        """Return count, timeouts and p50/p95/p99 in milliseconds."""
+        result: Dict[str, float | int | None] = {
+            "count": self.count,
+            "timeouts": self.timeouts,
+        }
+        for percent in (50, 95, 99):
+            value = self.percentile(percent)
+            result[f"p{percent}"] = None if value is None else round(value * 1000, 1)
+        return result
+
+
+class LatencyTracker:
+    """Match requests to responses and keep histograms per message."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the tracker."""
+        self._timeout = timeout
+        self.total = LatencyHistogram()
+        self.by_message: Dict[str, LatencyHistogram] = {}
+        self._sent_at: Dict[int, Tuple[str, float]] = {}
+
+    def _histogram(self, key: str) -> LatencyHistogram:
+        """Return the histogram of a message key."""
+        histogram = self.by_message.get(key)
+        if histogram is None:
+            histogram = self.by_message[key] = LatencyHistogram()
+        return histogram
+
+    def request_sent(self, message_id: int, key: str, now: float) -> None:
+        """Remember when a request went out.
+
+        With an older request of the same ID still unanswered the older
+        timestamp is kept, because the next response answers that one, unless
+        it is past the timeout, in which case it is counted as timed out.
+        """
+        pending = self._sent_at.get(message_id)
+        if pending is not None:
+            if now - pending[1] < self._timeout:
+                return
+            self._count_timeout(pending[0])
+        self._sent_at[message_id] = (key, now)
+
+    def response_received(self, message_id: int, now: float) -> None:
+        """Record the latency of the request answered by a response."""
+        pending = self._sent_at.pop(message_id, None)
+        if pending is None:
+            return
+        latency = now - pending[1]
+        self.total.record(latency)
+        self._histogram(pending[0]).record(latency)
+
+    def request_timed_out(self, message_id: int) -> None:
+        """Count the outstanding request of an ID as timed out."""
+        pending = self._sent_at.pop(message_id, None)
+        if pending is not None:
+            self._count_timeout(pending[0])
+
+    def discard_pending(self) -> None:
+        """Forget outstanding requests, e.g. after the connection was lost."""
+        self._sent_at.clear()
+
+    def _count_timeout(self, key: str) -> None:
+        """Count a timeout for a message key."""
+        self.total.record_timeout()
+        self._histogram(key).record_timeout()
+
+    def percentile_ms(self, percent: float) -> float | None:
+        """Return an overall percentile in milliseconds."""
+        value = self.total.percentile(percent)
+        return None if value is None else round(value * 1000, 1)
+
+    @property
+    def timeouts(self) -> int:
+        """Return the number of unanswered requests."""
+        return self.total.timeouts
+
+    def as_attributes(self) -> Dict[str, Dict[str, float | int | None]]:
+        """Return the per-message summaries."""
+        return {key: histogram.summary() for key, histogram in self.by_message.items()}
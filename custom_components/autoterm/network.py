@@ -0,0 +1,283 @@
+"""Network transports for heaters behind serial-to-Ethernet bridges.
+
+Two URL schemes are supported next to local serial ports:
+
+* ``socket://host:port`` - a raw TCP connection to the bridge.
+* ``rfc2217://host:port`` - a Telnet connection using the COM-PORT-OPTION
+  (RFC 2217) to set the line parameters on the bridge.
+
+Both run on the event loop's non-blocking socket transport with Nagle's
+algorithm disabled, since the heater frames are a few bytes each, and with
+TCP keepalive enabled so dead bridges are noticed.
+"""
+
+import asyncio
+import logging
+import socket
+import struct
+from typing import Any, Callable, Tuple
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+NETWORK_SCHEMES = ("socket", "rfc2217")
+
+CONNECT_TIMEOUT = 10.0
+KEEPALIVE_IDLE = 10
+KEEPALIVE_INTERVAL = 5
+KEEPALIVE_COUNT = 3
+
+# Telnet commands and options used by RFC 2217
+IAC = 0xFF
+DONT = 0xFE
+DO = 0xFD
+WONT = 0xFC
+WILL = 0xFB
+SB = 0xFA
+SE = 0xF0
+BINARY = 0x00
+SGA = 0x03
+COM_PORT_OPTION = 0x2C
+
+SET_BAUDRATE = 1
+SET_DATASIZE = 2
+SET_PARITY = 3
+SET_STOPSIZE = 4
+SET_CONTROL = 5
+PARITY_NONE = 1
+STOPSIZE_ONE = 1
+CONTROL_NO_FLOW = 1
+
+ACCEPTED_OPTIONS = frozenset((BINARY, SGA, COM_PORT_OPTION))
+
+_IAC_BYTE = bytes([IAC])
+
+
+def is_network_url(port: str) -> bool:
+    """Return True if port is a socket:// or rfc2217:// URL."""
+    return port.partition("://")[0].lower() in NETWORK_SCHEMES
+
+
+def parse_network_url(url: str) -> Tuple[str, str, int]:
+    """Split a network URL into scheme, host and port."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in NETWORK_SCHEMES:
+        raise ValueError(f"Unsupported URL scheme: {url}")
+    try:
+        port = parts.port
+    except ValueError as ex:
+        raise ValueError(f"Invalid port in URL: {url}") from ex
+    if not parts.hostname or port is None:
+        raise ValueError(f"Expected {scheme}://host:port, got {url}")
+    return scheme, parts.hostname, port
+
+
+def configure_socket(sock: socket.socket) -> None:
+    """Disable Nagle and enable TCP keepalive on a bridge connection."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, option):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+
+def test_network_url(url: str, timeout: float = CONNECT_TIMEOUT) -> None:
+    """Check that the bridge behind url accepts connections (blocking)."""
+    _, host, port = parse_network_url(url)
+    with socket.create_connection((host, port), timeout=timeout):
+        pass
+
+
+class TelnetDecoder:
+    """Strip Telnet commands from a byte stream.
+
+    Data bytes are returned from ``feed``; option negotiations are reported
+    through ``on_option(command, option)``. Subnegotiations (the bridge's
+    COM-PORT-OPTION replies) are dropped.
+    """
+
+    DATA, COMMAND, OPTION, SUBNEG, SUBNEG_IAC = range(5)
+
+    def __init__(self, on_option: Callable[[int, int], None]) -> None:
+        """Initialize the decoder."""
+        self._on_option = on_option
+        self._state = self.DATA
+        self._command = 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Return the data bytes contained in data."""
+        if self._state == self.DATA and IAC not in data:
+            return data
+
+        out = bytearray()
+        for byte in data:
+            state = self._state
+            if state == self.DATA:
+                if byte == IAC:
+                    self._state = self.COMMAND
+                else:
+                    out.append(byte)
+            elif state == self.COMMAND:
+                if byte == IAC:
+                    out.append(IAC)
+                    self._state = self.DATA
+                elif byte in (DO, DONT, WILL, WONT):
+                    self._command = byte
+                    self._state = self.OPTION
+                elif byte == SB:
+                    self._state = self.SUBNEG
+                else:
+                    self._state = self.DATA
+            elif state == self.OPTION:
+                self._state = self.DATA
+                self._on_option(self._command, byte)
+            elif state == self.SUBNEG:
+                if byte == IAC:
+                    self._state = self.SUBNEG_IAC
+            elif byte == SE:
+                self._state = self.DATA
+            else:
+                self._state = self.SUBNEG
+        return bytes(out)
+
+
+class RFC2217Transport(asyncio.Transport):
+    """Transport handed to the device protocol on an RFC 2217 connection.
+
+    Escapes IAC bytes in outgoing data and forwards everything else to the
+    underlying socket transport.
+    """
+
+    def __init__(self, transport: asyncio.Transport) -> None:
+        """Initialize the transport."""
+        super().__init__()
+        self._transport = transport
+
+    def write(self, data: bytes) -> None:
+        """Write data bytes, escaping Telnet IAC."""
+        if IAC in data:
+            data = bytes(data).replace(_IAC_BYTE, _IAC_BYTE * 2)
+        self._transport.write(data)
+
+    def write_command(self, data: bytes) -> None:
+        """Write a Telnet command unescaped."""
+        self._transport.write(data)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Return transport specific information."""
+        return self._transport.get_extra_info(name, default)
+
+    def get_write_buffer_size(self) -> int:
+        """Return the number of bytes waiting to be written."""
+        return self._transport.get_write_buffer_size()
+
+    def is_closing(self) -> bool:
+        """Return True if the transport is closing or closed."""
+        return self._transport.is_closing()
+
+    def close(self) -> None:
+        """Close the connection after pending writes are flushed."""
+        self._transport.close()
+
+    def abort(self) -> None:
+        """Close the connection immediately."""
+        self._transport.abort()
+
+
+class RFC2217Protocol(asyncio.Protocol):
+    """Negotiate RFC 2217 and pass the data stream on to the device protocol."""
+
+    def __init__(self, protocol: asyncio.Protocol, baudrate: int) -> None:
+        """Initialize the protocol."""
+        self.protocol = protocol
+        self._baudrate = baudrate
+        self._decoder = TelnetDecoder(self._handle_option)
+        self._transport: RFC2217Transport | None = None
+        self._replied: dict[int, int] = {}
+
+    @property
+    def transport(self) -> RFC2217Transport | None:
+        """Return the transport handed to the device protocol."""
+        return self._transport
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Request binary mode and set the line parameters on the bridge."""
+        self._transport = RFC2217Transport(transport)
+        commands = bytearray()
+        for command, option in (
+            (WILL, BINARY),
+            (DO, BINARY),
+            (WILL, SGA),
+            (DO, SGA),
+            (WILL, COM_PORT_OPTION),
+        ):
+            commands += bytes([IAC, command, option])
+            self._replied[option * 2 + (command in (DO, DONT))] = command
+        for subcommand, value in (
+            (SET_BAUDRATE, struct.pack(">I", self._baudrate)),
+            (SET_DATASIZE, bytes([8])),
+            (SET_PARITY, bytes([PARITY_NONE])),
+            (SET_STOPSIZE, bytes([STOPSIZE_ONE])),
+            (SET_CONTROL, bytes([CONTROL_NO_FLOW])),
+        ):
+            value = value.replace(_IAC_BYTE, _IAC_BYTE * 2)
+            commands += bytes([IAC, SB, COM_PORT_OPTION, subcommand])
+            commands += value + bytes([IAC, SE])
+        self._transport.write_command(bytes(commands))
+        self.protocol.connection_made(self._transport)
+
+    def _handle_option(self, command: int, option: int) -> None:
+        """Answer an option negotiation once per option and direction."""
+        accept = option in ACCEPTED_OPTIONS
+        if command in (DO, DONT):
+            reply = WILL if command == DO and accept else WONT
+            slot = option * 2
+        else:
+            reply = DO if command == WILL and accept else DONT
+            slot = option * 2 + 1
+        if self._replied.get(slot) == reply:
+            return
+        self._replied[slot] = reply
+        self._transport.write_command(bytes([IAC, reply, option]))
+
+    def data_received(self, data: bytes) -> None:
+        """Strip Telnet commands and forward the serial data."""
+        data = self._decoder.feed(data)
+        if data:
+            self.protocol.data_received(data)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Forward the loss of the connection."""
+        self.protocol.connection_lost(exc)
+
+
+async def create_network_connection(
+    loop: asyncio.AbstractEventLoop,
+    protocol_factory: Callable[[], asyncio.Protocol],
+    url: str,
+    baudrate: int = 9600,
+    timeout: float = CONNECT_TIMEOUT,
+) -> Tuple[asyncio.Transport, asyncio.Protocol]:
+    """Connect to a serial-to-Ethernet bridge given as a network URL."""
+    scheme, host, port = parse_network_url(url)
+    if scheme == "rfc2217":
+        factory = lambda: RFC2217Protocol(protocol_factory(), baudrate)  # noqa: E731
+    else:
+        factory = protocol_factory
+
+    transport, protocol = await asyncio.wait_for(
+        loop.create_connection(factory, host, port), timeout
+    )
+    sock = transport.get_extra_info("socket")
+    if sock is not None:
+        configure_socket(sock)
+    _LOGGER.debug("Connected to %s bridge at %s:%s", scheme, host, port)
+
+    if isinstance(protocol, RFC2217Protocol):
+        return protocol.transport, protocol.protocol
+    return transport, protocol
@@ -7,11 +7,10 @@ from homeassistant.components.number import NumberEntity, NumberDeviceClass
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, MANUFACTURER, MODEL, TEMP_MIN, TEMP_MAX
-from .device import SIGNAL_STATE_UPDATED, AutotermDevice
+from .device import AutotermDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,16 +65,18 @@ class AutotermNumber(NumberEntity):
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry_id)},
         }
-        self._status_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_{key}")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to Home Assistant."""
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._status_updated_signal, self.async_write_ha_state
-            )
+            self._device.async_add_listener((self._key,), self.async_write_ha_state)
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True while the heater is connected."""
+        return self._device.available
+
     @property
     def native_value(self) -> Any:
         """Return the current value."""
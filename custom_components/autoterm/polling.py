@@ -0,0 +1,108 @@
+"""Adaptive status polling for the Autoterm heater."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    DEFAULT_POLL_INTERVAL_FAST,
+    DEFAULT_POLL_INTERVAL_IDLE,
+    DEFAULT_POLL_INTERVAL_STEADY,
+    IDLE_STATUS_CODES,
+    POLL_BOOST_DURATION,
+    STEADY_STATUS_CODES,
+)
+
+if TYPE_CHECKING:
+    from .device import AutotermDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AutotermPoller:
+    """Poll status and settings at a rate that follows the heater phase.
+
+    Start-up, ramp and cool-down phases are polled at the fast interval,
+    steady heating or ventilation at the steady interval and standby at the
+    idle interval. Any command sent to the heater switches to the fast
+    interval for POLL_BOOST_DURATION seconds. No polls are sent while the
+    supervisor is reconnecting, the handshake fetches the status anyway.
+    """
+
+    def __init__(
+        self,
+        device: "AutotermDevice",
+        fast_interval: float = DEFAULT_POLL_INTERVAL_FAST,
+        steady_interval: float = DEFAULT_POLL_INTERVAL_STEADY,
+        idle_interval: float = DEFAULT_POLL_INTERVAL_IDLE,
+    ) -> None:
+        """Initialize the poller."""
+        self._device = device
+        self._loop = device.loop
+        self.fast_interval = fast_interval
+        self.steady_interval = steady_interval
+        self.idle_interval = idle_interval
+        self._boost_until = 0.0
+        self._last_poll = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._remove_command_listener = None
+
+    @property
+    def interval(self) -> float:
+        """Return the interval to wait before the next poll."""
+        if self._loop.time() < self._boost_until:
+            return self.fast_interval
+        status_code = self._device.status_data.get("status_code")
+        if status_code in IDLE_STATUS_CODES:
+            return self.idle_interval
+        if status_code in STEADY_STATUS_CODES:
+            return self.steady_interval
+        return self.fast_interval
+
+    def start(self) -> None:
+        """Start polling."""
+        self._remove_command_listener = self._device.add_command_listener(self.boost)
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._remove_command_listener:
+            self._remove_command_listener()
+            self._remove_command_listener = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @callback
+    def boost(self) -> None:
+        """Poll at the fast interval for a while, e.g. after a command."""
+        self._boost_until = self._loop.time() + POLL_BOOST_DURATION
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Poll until stopped."""
+        while True:
+            self._last_poll = self._loop.time()
+            if self._device.available:
+                try:
+                    await self._device.poll()
+                except Exception as ex:
+                    _LOGGER.error("Error polling device status: %s", ex)
+
+            # A boost re-evaluates the deadline, it does not poll on its own.
+            while True:
+                self._wakeup.clear()
+                delay = self._last_poll + self.interval - self._loop.time()
+                if delay <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    break
@@ -0,0 +1,387 @@
+"""Frame level protocol helpers for the Autoterm heater."""
+
+import struct
+from typing import Any, Callable, Iterator, Mapping, NamedTuple
+
+from .const import MESSAGE_TYPES, STATUS_OPTIONS
+
+START_BYTE = 0xAA
+
+# start + type + length + padding + id
+HEADER_LENGTH = 5
+CHECKSUM_LENGTH = 2
+FRAME_OVERHEAD = HEADER_LENGTH + CHECKSUM_LENGTH
+
+
+CRC_POLYNOMIAL = 0xA001
+
+
+def _build_crc_table() -> tuple[int, ...]:
+    """Precompute the CRC-16/MODBUS remainder for every byte value."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ CRC_POLYNOMIAL if crc & 0x0001 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC_TABLE = _build_crc_table()
+
+
+def crc16(data: bytes | bytearray | memoryview) -> int:
+    """Return the CRC-16/MODBUS of data as an integer."""
+    crc = 0xFFFF
+    table = CRC_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def calc_checksum(data: bytes | bytearray | memoryview) -> bytes:
+    """Return the two checksum bytes (big endian) for a message."""
+    return crc16(data).to_bytes(2, "big")
+
+
+def verify_checksum(frame: bytes | bytearray | memoryview) -> bool:
+    """Return True if the trailing two bytes of frame hold its checksum."""
+    if len(frame) < CHECKSUM_LENGTH:
+        return False
+    crc = crc16(frame[:-CHECKSUM_LENGTH])
+    return frame[-2] == crc >> 8 and frame[-1] == crc & 0xFF
+
+
+def build_frame(message_id: int, payload: bytes = b"", type_value: int = 0x03) -> bytes:
+    """Build a checksummed frame, a request unless type_value says otherwise."""
+    header = bytes([START_BYTE, type_value, len(payload), 0x00, message_id])
+    return header + payload + calc_checksum(header + payload)
+
+
+class FrameParser:
+    """Incremental frame parser with checksum based resynchronisation.
+
+    Chunks of any size are appended to an internal ``bytearray`` and complete
+    frames are yielded as ``memoryview`` slices of that buffer, so no frame is
+    copied. A frame view is only valid until the next call to :meth:`feed`;
+    copy it with ``bytes(frame)`` if it has to be kept.
+
+    When a candidate frame fails its checksum the parser does not drop the
+    bytes covered by its (possibly corrupt) length field. It rewinds to the
+    next ``0xAA`` after the bad start marker, so a stray start byte inside a
+    payload or a truncated frame costs at most the bytes before the next
+    valid frame.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._buffer = bytearray()
+        self._pos = 0
+        self.frames_ok = 0
+        self.resyncs = 0
+        self.bytes_discarded = 0
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes waiting for the rest of a frame."""
+        return len(self._buffer) - self._pos
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return line quality counters."""
+        return {
+            "frames_ok": self.frames_ok,
+            "resyncs": self.resyncs,
+            "bytes_discarded": self.bytes_discarded,
+        }
+
+    def reset(self) -> None:
+        """Drop buffered data, keeping the counters."""
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _compact(self) -> None:
+        """Drop consumed bytes from the front of the buffer."""
+        if not self._pos:
+            return
+        try:
+            del self._buffer[: self._pos]
+        except BufferError:
+            # A caller still holds a frame view; leave that buffer to it.
+            self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+    @staticmethod
+    def _find_frame(
+        buffer: bytearray, view: memoryview, pos: int, end_of_data: int
+    ) -> int:
+        """Return the offset of the next complete valid frame, or -1."""
+        while True:
+            start = buffer.find(START_BYTE, pos)
+            if start < 0 or end_of_data - start < 3:
+                return -1
+            end = start + FRAME_OVERHEAD + buffer[start + 2]
+            if (
+                end <= end_of_data
+                and buffer[start + 1] in MESSAGE_TYPES
+                and verify_checksum(view[start:end])
+            ):
+                return start
+            pos = start + 1
+
+    def feed(self, data: bytes) -> Iterator[memoryview]:
+        """Append a chunk of received bytes and yield every complete frame."""
+        self._compact()
+        buffer = self._buffer
+        buffer += data
+        end_of_data = len(buffer)
+        pos = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                start = buffer.find(START_BYTE, pos)
+                if start < 0:
+                    self.bytes_discarded += end_of_data - pos
+                    pos = end_of_data
+                    break
+                if start > pos:
+                    self.bytes_discarded += start - pos
+                    pos = start
+
+                if end_of_data - pos < 3:
+                    break
+                if buffer[pos + 1] not in MESSAGE_TYPES:
+                    self.resyncs += 1
+                    self.bytes_discarded += 1
+                    pos += 1
+                    continue
+
+                end = pos + FRAME_OVERHEAD + buffer[pos + 2]
+                if end > end_of_data:
+                    # A corrupt length byte must not stall frames that have
+                    # already arrived behind it.
+                    next_frame = self._find_frame(buffer, view, pos + 1, end_of_data)
+                    if next_frame < 0:
+                        break
+                    self.resyncs += 1
+                    self.bytes_discarded += next_frame - pos
+                    pos = next_frame
+                    continue
+
+                if not verify_checksum(view[pos:end]):
+                    # Rewind to the next candidate start marker.
+                    self.resyncs += 1
+                    self.bytes_discarded += 1
+                    pos += 1
+                    continue
+
+                self.frames_ok += 1
+                self._pos = end
+                yield view[pos:end]
+                pos = end
+
+        self._pos = pos
+
+
+class Field(NamedTuple):
+    """A value at a fixed offset of a message payload.
+
+    format is a single big endian struct code, scale converts the raw value
+    to its unit. Fields with a title are exposed as sensors.
+    """
+
+    name: str
+    offset: int
+    format: str = "B"
+    scale: float = 1
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    title: str | None = None
+
+
+class Record:
+    """Base class for decoded payloads, one slot per field."""
+
+    __slots__ = ()
+    keys: tuple[str, ...] = ()
+    _key_set: frozenset[str] = frozenset()
+
+    def __init__(self) -> None:
+        """Initialize every value as unknown."""
+        for key in self.keys:
+            setattr(self, key, None)
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is a field of this record."""
+        return key in self._key_set
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a field."""
+        if key not in self._key_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"{type(self).__name__}({self.as_dict()})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a field, or default for unknown keys."""
+        if key not in self._key_set:
+            return default
+        return getattr(self, key)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        return {key: getattr(self, key) for key in self.keys}
+
+
+class FrameCodec:
+    """Decoder and encoder generated from a declarative field table.
+
+    All fields are unpacked by one precompiled ``struct.Struct``; gaps
+    between fields are skipped as padding. Derived values are computed from
+    the decoded record after every decode.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: tuple[Field, ...],
+        derived: tuple[tuple[str, Callable[[Record, int], Any]], ...] = (),
+    ) -> None:
+        """Compile the field table."""
+        fields = tuple(sorted(fields, key=lambda field: field.offset))
+        layout = ">"
+        position = 0
+        for field in fields:
+            if field.offset < position:
+                raise ValueError(f"Field {field.name} overlaps its predecessor")
+            layout += "x" * (field.offset - position) + field.format
+            position = field.offset + struct.calcsize(">" + field.format)
+
+        self.fields = fields
+        self.derived = derived
+        self._struct = struct.Struct(layout)
+        self.size = self._struct.size
+        self._decoders = tuple(
+            (field.name, self._decoder(field.scale)) for field in fields
+        )
+        keys = tuple(field.name for field in fields) + tuple(
+            key for key, _ in derived
+        )
+        self.record_type: type[Record] = type(
+            name,
+            (Record,),
+            {"__slots__": keys, "keys": keys, "_key_set": frozenset(keys)},
+        )
+
+    @staticmethod
+    def _decoder(scale: float) -> Callable[[int], Any] | None:
+        """Return the raw to unit conversion for a scale."""
+        if scale == 1:
+            return None
+        if scale > 1:
+            return lambda raw: raw * scale
+        # Divide by the exact integer so 13 * 0.1 does not turn into 1.3000000000000003
+        divisor = round(1 / scale)
+        return lambda raw: raw / divisor
+
+    def new_record(self) -> Record:
+        """Return a record with every value unknown."""
+        return self.record_type()
+
+    def decode(self, payload: bytes | memoryview) -> Record:
+        """Decode a payload into a new record."""
+        record = self.record_type()
+        self.decode_into(record, payload)
+        return record
+
+    def decode_into(self, record: Record, payload: bytes | memoryview) -> set[str]:
+        """Decode a payload in place and return the names of changed values."""
+        changed = set()
+        for (name, decoder), raw in zip(
+            self._decoders, self._struct.unpack_from(payload)
+        ):
+            value = raw if decoder is None else decoder(raw)
+            if getattr(record, name) != value:
+                setattr(record, name, value)
+                changed.add(name)
+        length = len(payload)
+        for name, derive in self.derived:
+            value = derive(record, length)
+            if getattr(record, name) != value:
+                setattr(record, name, value)
+                changed.add(name)
+        return changed
+
+    def encode(self, values: Mapping[str, Any], base: bytes = b"") -> bytes:
+        """Return base with the given field values packed over it.
+
+        Bytes not covered by the field table, and fields not in values,
+        keep their value from base.
+        """
+        buffer = bytearray(base)
+        if len(buffer) < self.size:
+            buffer.extend(bytes(self.size - len(buffer)))
+        raw_values = list(self._struct.unpack_from(buffer))
+        for index, field in enumerate(self.fields):
+            if field.name in values:
+                raw_values[index] = round(values[field.name] / field.scale)
+        self._struct.pack_into(buffer, 0, *raw_values)
+        return bytes(buffer)
+
+
+def _status_code(record: Record, length: int) -> str:
+    """Return the combined status code, e.g. "3.0"."""
+    return f"{record.status_major}.{record.status_minor}"
+
+
+STATUS_FIELDS = (
+    Field("status_major", 0),
+    Field("status_minor", 1),
+    Field("error_code", 2, title="Error Code"),
+    Field("board_temp", 3, "b", unit="°C", device_class="temperature", state_class="measurement", title="Intake Temperature"),
+    Field("external_temp", 4, "b", unit="°C", device_class="temperature", state_class="measurement"),
+    Field("mystery0", 5, title="Mystery 0"),
+    Field("voltage", 6, scale=0.1, unit="V", device_class="voltage", state_class="measurement", title="Voltage"),
+    Field("flame_temperature", 7, "H", unit="K", device_class="temperature", state_class="measurement", title="Flame Temperature"),
+    Field("mystery1", 9, title="Mystery 1"),
+    Field("mystery2", 10, title="Mystery 2"),
+    Field("fan_rpm_specified", 11, scale=60, state_class="measurement", title="Fan RPM Specified"),
+    Field("fan_rpm_actual", 12, scale=60, state_class="measurement", title="Fan RPM"),
+    Field("mystery3", 13, title="Mystery 3"),
+    Field("frequency_fuel_pump", 14, scale=0.01, unit="Hz", device_class="frequency", state_class="measurement", title="Fuel Pump Frequency"),
+    Field("mystery4", 15, title="Mystery 4"),
+    Field("frequency_fuel_pump_actual", 16, scale=0.01, unit="Hz", device_class="frequency", state_class="measurement", title="Fuel Pump Frequency Actual"),
+    Field("glow_plug_current", 17, scale=0.1, unit="A", device_class="current", state_class="measurement", title="Glow Plug Current"),
+    Field("mystery5", 18, title="Mystery 5"),
+)
+
+STATUS_CODEC = FrameCodec(
+    "StatusRecord",
+    STATUS_FIELDS,
+    derived=(
+        ("status_code", _status_code),
+        ("status", lambda record, length: STATUS_OPTIONS.get(record.status_code, "unknown")),
+        ("status_length", lambda record, length: length),
+    ),
+)
+
+SETTINGS_FIELDS = (
+    Field("work_time", 0, "H"),
+    Field("sensor", 2),
+    Field("temperature_target", 3),
+    Field("mode", 4),
+    Field("level", 5),
+)
+
+SETTINGS_CODEC = FrameCodec(
+    "SettingsRecord",
+    SETTINGS_FIELDS,
+    derived=(("power", lambda record, length: (record.level + 1) * 10),),
+)
+
+StatusRecord = STATUS_CODEC.record_type
+SettingsRecord = SETTINGS_CODEC.record_type
@@ -6,12 +6,12 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN, MANUFACTURER, MODEL, SENSOR_OPTIONS, MODE_OPTIONS
-from .device import SIGNAL_STATE_UPDATED, AutotermDevice
+from .device import AutotermDevice
+from .temperature_sensors import async_get_temperature_sensor_index
 
 _LOGGER = logging.getLogger(__name__)
 ATTR_SELECTED_ENTITY_ID = "selected_entity_id"
@@ -48,43 +48,50 @@ class ExternalTemperatureSensorSelect(SelectEntity, RestoreEntity):
             "identifiers": {(DOMAIN, entry_id)},
         }
         self._hass = hass
-        self._options = {}
+        self._sensor_index = async_get_temperature_sensor_index(hass)
+        self._options: dict[str, str] = {}
+        self._option_list: list[str] = []
+        self._options_key: tuple[int, str | None] | None = None
         self._refresh_options()
-        self._status_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_external_temperature_sensor")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to Home Assistant."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._sensor_index.async_start())
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._status_updated_signal, self.async_write_ha_state
+            self._sensor_index.async_add_listener(self.async_write_ha_state)
+        )
+        self.async_on_remove(
+            self._device.async_add_listener(
+                ("external_temperature_sensor",), self.async_write_ha_state
             )
         )
         await self._restore_selected_sensor()
 
     def _refresh_options(self) -> None:
-        """Refresh options and keep the currently selected sensor selectable."""
-        options = self.get_all_temperature_sensors(self._hass)
+        """Refresh options and keep the currently selected sensor selectable.
+
+        The options are only rebuilt when the sensor index or the selected
+        sensor changed.
+        """
         selected_sensor = self._device.get_external_temperature_sensor()
+        options_key = (self._sensor_index.version, selected_sensor)
+        if options_key == self._options_key:
+            return
+        options = {"none": "None"}  # Add "None" as the first option
+        options.update(self._sensor_index.sensors)
         if selected_sensor and selected_sensor not in options:
             selected_state = self._hass.states.get(selected_sensor)
             options[selected_sensor] = selected_state.name if selected_state else selected_sensor
         self._options = options
-
-    def get_all_temperature_sensors(self, hass: HomeAssistant) -> dict:
-        """Return all available temperature sensors with a None option."""
-        entities = hass.states.async_all("sensor")
-        sensors = {"none": "None"}  # Add "None" as the first option
-        for entity in entities:
-            if entity.attributes.get("device_class") == "temperature":
-                sensors[entity.entity_id] = entity.name
-        return sensors
+        self._option_list = list(options.values())
+        self._options_key = options_key
 
     @property
     def options(self) -> list[str]:
         """Return a set of available options."""
         self._refresh_options()
-        return list(self._options.values())
+        return self._option_list
 
     @property
     def current_option(self) -> str | None:
@@ -106,7 +113,6 @@ class ExternalTemperatureSensorSelect(SelectEntity, RestoreEntity):
                     await self._device.set_external_temperature_sensor(None)
                 else:
                     await self._device.set_external_temperature_sensor(key)
-                    await self._submit_external_temperature_from_sensor(key)
                 self.async_write_ha_state()
                 return
 
@@ -155,47 +161,6 @@ class ExternalTemperatureSensorSelect(SelectEntity, RestoreEntity):
 
         if isinstance(restored_entity_id, str):
             await self._device.set_external_temperature_sensor(restored_entity_id)
-            await self._submit_external_temperature_from_sensor(restored_entity_id)
-
-    async def _submit_external_temperature_from_sensor(self, sensor_entity_id: str) -> None:
-        """Submit current selected sensor temperature to the heater."""
-        temp_state = self._hass.states.get(sensor_entity_id)
-        if not temp_state:
-            _LOGGER.debug("Temperature entity %s not found", sensor_entity_id)
-            if await self._device.submit_cached_external_temperature():
-                _LOGGER.debug(
-                    "Resubmitted cached external temperature after missing sensor %s",
-                    sensor_entity_id,
-                )
-            return
-        if temp_state.state in ("unknown", "unavailable"):
-            _LOGGER.debug(
-                "Temperature entity %s has non-numeric state %s",
-                sensor_entity_id,
-                temp_state.state,
-            )
-            if await self._device.submit_cached_external_temperature():
-                _LOGGER.debug(
-                    "Resubmitted cached external temperature because %s is %s",
-                    sensor_entity_id,
-                    temp_state.state,
-                )
-            return
-        try:
-            temp_value = float(temp_state.state)
-        except (ValueError, TypeError):
-            _LOGGER.debug(
-                "Temperature entity %s has invalid numeric value %s",
-                sensor_entity_id,
-                temp_state.state,
-            )
-            if await self._device.submit_cached_external_temperature():
-                _LOGGER.debug(
-                    "Resubmitted cached external temperature due to invalid value from %s",
-                    sensor_entity_id,
-                )
-            return
-        await self._device.submit_external_temperature(temp_value)
 
 class AutotermSelect(SelectEntity):
     """Representation of an Autoterm select entity."""
@@ -218,21 +183,22 @@ class AutotermSelect(SelectEntity):
             "model": MODEL,
             "sw_version": device.version,
         }
-        self._status_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_{key}")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to Home Assistant."""
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._status_updated_signal, self.async_write_ha_state
-            )
+            self._device.async_add_listener((self._key,), self.async_write_ha_state)
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True while the heater is connected."""
+        return self._device.available
+
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
         key_value = self._device.get_entity_state(self._key)
-        _LOGGER.info(f"Current Option {self._key}: {key_value}")
         return self._options.get(key_value)
 
     async def async_select_option(self, option: str) -> None:
@@ -1,47 +1,87 @@
 """Sensor platform for Autoterm integration."""
+import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.const import UnitOfTemperature, UnitOfElectricPotential
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime, UnitOfVolume
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 # from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL, STATUS_OPTIONS
-from .device import SIGNAL_STATE_UPDATED, AutotermDevice
+from .const import (
+    CONF_DEADBAND_PREFIX,
+    CONF_MIN_INTERVAL_PREFIX,
+    CONF_SENSOR_MAX_AGE,
+    CONNECTION_STATES,
+    DEFAULT_SENSOR_MAX_AGE,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    SENSOR_WRITE_FILTERS,
+    STATUS_OPTIONS,
+)
+from .device import AutotermDevice
+from .protocol import STATUS_FIELDS, Field
+from .write_filter import StateWriteFilter
 
 _LOGGER = logging.getLogger(__name__)
 STATUS_STATE_OPTIONS = list(dict.fromkeys(["unknown", *STATUS_OPTIONS.values()]))
 
+
+def _field_sensor_type(field: Field) -> tuple:
+    """Return the sensor description of a status payload field."""
+    return (
+        field.title,
+        field.unit,
+        SensorDeviceClass(field.device_class) if field.device_class else None,
+        SensorStateClass(field.state_class) if field.state_class else None,
+    )
+
+
+# Status payload fields with a title become sensors, see protocol.STATUS_FIELDS
 SENSOR_TYPES = {
     "status_code": ("Status Code", None, None, None),
     "status": ("Status", None, None, None),
-    "error_code": ("Error Code", None, None, None),
-    "mystery0": ("Mystery 0", None, None, None),
-    "mystery1": ("Mystery 1", None, None, None),
-    "mystery2": ("Mystery 2", None, None, None),
-    "mystery3": ("Mystery 3", None, None, None),
-    "mystery4": ("Mystery 4", None, None, None),
-    "mystery5": ("Mystery 5", None, None, None),
+    **{
+        field.name: _field_sensor_type(field)
+        for field in STATUS_FIELDS
+        if field.title
+    },
     "status_length": ("Status Length", None, None, None),
-    "board_temp": ("Intake Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    #"external_temp": ("External Sensor Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
     "controller_temp": ("Controller Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    "voltage": ("Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT),
-    #"temperature_heat_exchanger": ("Heat Exchanger Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    "flame_temperature": ("Flame Temperature", UnitOfTemperature.KELVIN, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    #"temperature_panel": ("Control Panel Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    "fan_rpm_specified": ("Fan RPM Specified", None, None, SensorStateClass.MEASUREMENT),
-    "fan_rpm_actual": ("Fan RPM", None, None, SensorStateClass.MEASUREMENT),
-    "frequency_fuel_pump": ("Fuel Pump Frequency", "Hz", SensorDeviceClass.FREQUENCY , SensorStateClass.MEASUREMENT),
-    "frequency_fuel_pump_actual": ("Fuel Pump Frequency Actual", "Hz", SensorDeviceClass.FREQUENCY , SensorStateClass.MEASUREMENT),
-    "glow_plug_current": ("Glow Plug Current", "A", SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT),
-    #"work_time": ("Work Time", "h", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "fuel_consumed": ("Fuel Consumed", UnitOfVolume.LITERS, SensorDeviceClass.VOLUME, SensorStateClass.TOTAL_INCREASING),
+    "burner_runtime": ("Burner Runtime", UnitOfTime.HOURS, SensorDeviceClass.DURATION, SensorStateClass.TOTAL_INCREASING),
+}
+
+# Connection health, available even while the heater is disconnected
+DIAGNOSTIC_SENSOR_TYPES = {
+    "connection_state": ("Connection State", None, SensorDeviceClass.ENUM, None),
+    "reconnects": ("Reconnects", None, None, SensorStateClass.TOTAL_INCREASING),
+    "connection_failures": ("Connection Failures", None, None, SensorStateClass.TOTAL_INCREASING),
+    "latency_p50": ("Latency p50", UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "latency_p95": ("Latency p95", UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "latency_p99": ("Latency p99", UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT),
+    "response_timeouts": ("Response Timeouts", None, None, SensorStateClass.TOTAL_INCREASING),
 }
 
+# Diagnostic sensors that carry a per-message breakdown as attributes
+LATENCY_SENSOR_KEYS = ("latency_p50", "latency_p95", "latency_p99", "response_timeouts")
+
+
+def _write_filter(options: dict[str, Any], key: str) -> StateWriteFilter | None:
+    """Return the state write filter of a sensor from the entry options."""
+    if key not in SENSOR_WRITE_FILTERS:
+        return None
+    deadband, min_interval = SENSOR_WRITE_FILTERS[key]
+    return StateWriteFilter(
+        options.get(f"{CONF_DEADBAND_PREFIX}{key}", deadband),
+        options.get(f"{CONF_MIN_INTERVAL_PREFIX}{key}", min_interval),
+        options.get(CONF_SENSOR_MAX_AGE, DEFAULT_SENSOR_MAX_AGE),
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -49,7 +89,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Autoterm sensor platform."""
     device: AutotermDevice = hass.data[DOMAIN][entry.entry_id]
-    entities = [AutotermSensor(device, entry.entry_id, key) for key in SENSOR_TYPES]
+    entities = [
+        AutotermSensor(device, entry.entry_id, key, _write_filter(entry.options, key))
+        for key in SENSOR_TYPES
+    ]
+    entities.extend(
+        AutotermDiagnosticSensor(device, entry.entry_id, key)
+        for key in DIAGNOSTIC_SENSOR_TYPES
+    )
     # coordinator = device["coordinator"]
     # entities = [AutotermSensor(coordinator, device, entry.entry_id, key) for key in SENSOR_TYPES]
     async_add_entities(entities)
@@ -59,8 +106,17 @@ class AutotermSensor(SensorEntity):
     """Representation of an Autoterm sensor entity."""
 
     _attr_has_entity_name = True
+    _write_filter: StateWriteFilter | None = None
+    _write_timer: asyncio.TimerHandle | None = None
+    _written_available: bool | None = None
 
-    def __init__(self, device: AutotermDevice, entry_id: str, key: str):
+    def __init__(
+        self,
+        device: AutotermDevice,
+        entry_id: str,
+        key: str,
+        write_filter: StateWriteFilter | None = None,
+    ):
     # def __init__(self, coordinator, device: AutotermDevice, entry_id: str, key: str, name: str=None):
         """Initialize the sensor entity."""
         # super().__init__(coordinator)
@@ -68,6 +124,7 @@ class AutotermSensor(SensorEntity):
         self._entry_id = entry_id
         self._key = key
         # self._name = name
+        self._write_filter = write_filter
         self._attr_unique_id = f"{entry_id}_{key}"
         self._attr_translation_key = key
         _, self._attr_native_unit_of_measurement, self._attr_device_class,self._attr_state_class  = SENSOR_TYPES[key]
@@ -77,15 +134,49 @@ class AutotermSensor(SensorEntity):
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry_id)},
         }
-        self._status_updated_signal = SIGNAL_STATE_UPDATED.format(f"{entry_id}_{key}")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to Home Assistant."""
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._status_updated_signal, self.async_write_ha_state
+        if self._write_filter is None:
+            self.async_on_remove(
+                self._device.async_add_listener((self._key,), self.async_write_ha_state)
             )
+            return
+        self._write_filter.written(
+            self._device.get_entity_state(self._key), self.hass.loop.time()
         )
+        self._written_available = self.available
+        self.async_on_remove(
+            self._device.async_add_listener((self._key,), self._async_filtered_update)
+        )
+        self.async_on_remove(self._cancel_write_timer)
+
+    @callback
+    def _cancel_write_timer(self) -> None:
+        """Cancel a delayed state write."""
+        if self._write_timer is not None:
+            self._write_timer.cancel()
+            self._write_timer = None
+
+    @callback
+    def _async_filtered_update(self) -> None:
+        """Write the state if the change passes the deadband and rate limit."""
+        self._cancel_write_timer()
+        now = self.hass.loop.time()
+        value = self._device.get_entity_state(self._key)
+        delay = self._write_filter.check(value, now)
+        if self.available != self._written_available:
+            delay = 0.0
+        if delay is None:
+            return
+        if delay > 0:
+            self._write_timer = self.hass.loop.call_later(
+                delay, self._async_filtered_update
+            )
+            return
+        self._write_filter.written(value, now)
+        self._written_available = self.available
+        self.async_write_ha_state()
        
     # @property
     # def available(self):
@@ -118,5 +209,44 @@ class AutotermSensor(SensorEntity):
     @property
     def native_value(self) -> Any:
         """Return the current state of the sensor."""
+        if self._write_filter is not None:
+            return self._write_filter.value
         return self._device.get_entity_state(self._key)
 
+    @property
+    def available(self) -> bool:
+        """Return True while the heater is connected."""
+        return self._device.available
+
+
+class AutotermDiagnosticSensor(AutotermSensor):
+    """Sensor reporting the health of the connection to the heater."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, device: AutotermDevice, entry_id: str, key: str):
+        """Initialize the diagnostic sensor entity."""
+        self._device = device
+        self._entry_id = entry_id
+        self._key = key
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_translation_key = key
+        _, self._attr_native_unit_of_measurement, self._attr_device_class, self._attr_state_class = DIAGNOSTIC_SENSOR_TYPES[key]
+        if key == "connection_state":
+            self._attr_options = CONNECTION_STATES
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry_id)},
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True, connection health is always known."""
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return latency and timeouts per message for the latency sensors."""
+        if self._key not in LATENCY_SENSOR_KEYS:
+            return None
+        return self._device.latency.as_attributes()
+
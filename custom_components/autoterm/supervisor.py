@@ -0,0 +1,153 @@
+"""Connection supervision for the Autoterm heater."""
+
+import asyncio
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    CONNECTION_STATE_CONNECTED,
+    CONNECTION_STATE_CONNECTING,
+    CONNECTION_STATE_DISCONNECTED,
+    DEAD_PORT_TIMEOUTS,
+    RECONNECT_BACKOFF_INITIAL,
+    RECONNECT_BACKOFF_MAX,
+)
+
+if TYPE_CHECKING:
+    from .device import AutotermDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionSupervisor:
+    """Detect dead connections and re-establish them with backoff.
+
+    A connection is dead when the transport reports it lost or when
+    DEAD_PORT_TIMEOUTS requests in a row went unanswered. The supervisor
+    then reopens the port and repeats the version/status/settings handshake
+    until the heater answers. Attempts are spaced by an exponential backoff
+    with jitter, starting at RECONNECT_BACKOFF_INITIAL and capped at
+    RECONNECT_BACKOFF_MAX seconds.
+    """
+
+    def __init__(self, device: "AutotermDevice") -> None:
+        """Initialize the supervisor."""
+        self._device = device
+        self._loop = device.loop
+        self.state = CONNECTION_STATE_DISCONNECTED
+        self.reconnects = 0
+        self.connection_failures = 0
+        self._attempt = 0
+        self._consecutive_timeouts = 0
+        self._task: asyncio.Task | None = None
+        self._stopped = False
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the heater is reachable."""
+        return self.state == CONNECTION_STATE_CONNECTED
+
+    def next_delay(self) -> float:
+        """Return the jittered delay before the next attempt."""
+        delay = min(
+            RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_INITIAL * 2**self._attempt
+        )
+        return random.uniform(delay / 2, delay)
+
+    @callback
+    def _set_state(self, state: str) -> None:
+        """Update the connection state and notify listeners."""
+        if state == self.state:
+            return
+        _LOGGER.debug("Connection to %s is %s", self._device.port, state)
+        self.state = state
+        self._device._notify_state_update("connection_state")
+
+    @callback
+    def connection_established(self, responding: bool) -> None:
+        """Record the outcome of the initial connect."""
+        self._stopped = False
+        if responding:
+            self._set_state(CONNECTION_STATE_CONNECTED)
+        else:
+            self._set_state(CONNECTION_STATE_CONNECTING)
+            self._start()
+
+    @callback
+    def connection_lost(self) -> None:
+        """Start reconnecting after the transport went away."""
+        self._set_state(CONNECTION_STATE_DISCONNECTED)
+        self._start()
+
+    @callback
+    def response_received(self) -> None:
+        """Reset the dead port detection."""
+        self._consecutive_timeouts = 0
+
+    @callback
+    def response_timed_out(self) -> None:
+        """Count an unanswered request and drop the port once it looks dead."""
+        self._consecutive_timeouts += 1
+        if self._consecutive_timeouts < DEAD_PORT_TIMEOUTS:
+            return
+        self._consecutive_timeouts = 0
+        transport = self._device.transport
+        if transport is not None and not transport.is_closing():
+            _LOGGER.warning(
+                "No answer from heater at %s to %d requests, reopening the port",
+                self._device.port,
+                DEAD_PORT_TIMEOUTS,
+            )
+            transport.abort()
+
+    @callback
+    def _start(self) -> None:
+        """Run the reconnect loop unless it is already running."""
+        if self._stopped or (self._task and not self._task.done()):
+            return
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop reconnecting."""
+        self._stopped = True
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Reopen the port and repeat the handshake until the heater answers."""
+        device = self._device
+        while True:
+            delay = self.next_delay()
+            _LOGGER.debug("Reconnecting to %s in %.1f s", device.port, delay)
+            await asyncio.sleep(delay)
+
+            if device.transport is None:
+                self._set_state(CONNECTION_STATE_CONNECTING)
+                try:
+                    await device._open_transport()
+                except Exception as ex:  # pylint: disable=broad-except
+                    self._attempt += 1
+                    self.connection_failures += 1
+                    device._notify_state_update("connection_failures")
+                    self._set_state(CONNECTION_STATE_DISCONNECTED)
+                    _LOGGER.warning(f"Reconnecting to {device.port} failed: {ex}")
+                    continue
+                self.reconnects += 1
+                device._notify_state_update("reconnects")
+
+            if await device._handshake() and device.transport is not None:
+                _LOGGER.info("Reconnected to Autoterm heater at %s", device.port)
+                self._attempt = 0
+                self._set_state(CONNECTION_STATE_CONNECTED)
+                return
+
+            self._attempt += 1
+            _LOGGER.warning("Heater at %s did not answer the handshake", device.port)
@@ -0,0 +1,153 @@
+"""Long-term telemetry imported as external statistics."""
+
+import logging
+from datetime import datetime
+from typing import Callable, Dict
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, TELEMETRY_KEYS
+from .device import AutotermDevice
+from .protocol import STATUS_FIELDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimeWeightedAggregate:
+    """Running min, max and time-weighted mean of a signal.
+
+    The device only reports changes, so every value is weighted by how long
+    it was held. Memory use is constant no matter how often it changes.
+    """
+
+    __slots__ = ("minimum", "maximum", "_weighted_sum", "_duration", "_value", "_since")
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregate."""
+        self._value: float | None = None
+        self._since = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        """Start a new window with the held value."""
+        self.minimum = self.maximum = self._value
+        self._weighted_sum = 0.0
+        self._duration = 0.0
+
+    def _accumulate(self, now: float) -> None:
+        """Add the held value up to now."""
+        if self._value is not None:
+            elapsed = now - self._since
+            self._weighted_sum += self._value * elapsed
+            self._duration += elapsed
+        self._since = now
+
+    def update(self, value: float | None, now: float) -> None:
+        """Hold a new value from now on; None pauses the aggregate."""
+        self._accumulate(now)
+        self._value = value
+        if value is None:
+            return
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def roll(self, now: float) -> tuple[float, float, float] | None:
+        """Return (mean, min, max) of the window ending now and start the next."""
+        self._accumulate(now)
+        result = None
+        if self._duration > 0:
+            result = (self._weighted_sum / self._duration, self.minimum, self.maximum)
+        self._reset()
+        return result
+
+
+class TelemetryAggregator:
+    """Aggregate status signals per hour and import them as statistics.
+
+    The recorder only imports hourly statistics starting at the top of an
+    hour, so windows are aligned to the hour. Each window becomes one row per
+    signal in the long-term statistics (``autoterm:<entry>_<signal>``).
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, device: AutotermDevice, entry_id: str, name: str
+    ) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._device = device
+        self._aggregates: Dict[str, TimeWeightedAggregate] = {
+            key: TimeWeightedAggregate() for key in TELEMETRY_KEYS
+        }
+        fields = {field.name: field for field in STATUS_FIELDS}
+        self._metadata: Dict[str, StatisticMetaData] = {
+            key: StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{name} {fields[key].title}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{slugify(entry_id)}_{key}",
+                unit_of_measurement=fields[key].unit,
+            )
+            for key in TELEMETRY_KEYS
+        }
+        self._window_start = self._current_window_start()
+
+    @staticmethod
+    def _current_window_start() -> datetime:
+        """Return the start of the window containing now."""
+        return dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start aggregating; returns a function that stops it."""
+        self._sample()
+        unsubscribers: list[Callable[[], None]] = [
+            self._device.async_add_listener(TELEMETRY_KEYS, self._sample),
+            async_track_utc_time_change(
+                self._hass, self._async_roll, minute=0, second=0
+            ),
+        ]
+
+        @callback
+        def _stop() -> None:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return _stop
+
+    @callback
+    def _sample(self) -> None:
+        """Hold the current values, or pause while the heater is unavailable."""
+        now = self._device.loop.time()
+        available = self._device.available
+        for key, aggregate in self._aggregates.items():
+            value = self._device.get_entity_state(key) if available else None
+            aggregate.update(value, now)
+
+    @callback
+    def _async_roll(self, now: datetime) -> None:
+        """Import the window that just ended."""
+        start = self._window_start
+        self._window_start = now.replace(minute=0, second=0, microsecond=0)
+        loop_now = self._device.loop.time()
+        if "recorder" not in self._hass.config.components:
+            for aggregate in self._aggregates.values():
+                aggregate.roll(loop_now)
+            return
+        for key, aggregate in self._aggregates.items():
+            result = aggregate.roll(loop_now)
+            if result is None:
+                continue
+            mean, minimum, maximum = result
+            async_add_external_statistics(
+                self._hass,
+                self._metadata[key],
+                [StatisticData(start=start, mean=mean, min=minimum, max=maximum)],
+            )
+        _LOGGER.debug("Imported telemetry statistics for %s", start)
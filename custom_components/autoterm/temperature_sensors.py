@@ -0,0 +1,165 @@
+"""Incrementally maintained catalogue of temperature sensors."""
+
+import logging
+from typing import Any, Mapping
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DATA_TEMPERATURE_SENSOR_INDEX, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SENSOR_PREFIX = "sensor."
+
+
+class TemperatureSensorIndex:
+    """Keep the temperature sensors of Home Assistant indexed by entity id.
+
+    The index is filled once from the state machine and then updated from
+    state change and entity registry events, so readers never scan all
+    states. ``version`` is bumped whenever the catalogue changes, which lets
+    readers cache anything derived from it.
+
+    One index is shared by all config entries, see
+    async_get_temperature_sensor_index. It follows changes while at least
+    one user has started it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._sensors: dict[str, str] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._remove_listeners: list[CALLBACK_TYPE] = []
+        self._users = 0
+        self.version = 0
+
+    @property
+    def sensors(self) -> dict[str, str]:
+        """Return entity id to name for all temperature sensors."""
+        return self._sensors
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return True if the entity is an indexed temperature sensor."""
+        return entity_id in self._sensors
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow changes for one more user; returns a callback releasing it."""
+        self._users += 1
+        if self._users == 1:
+            self._async_build()
+        released = False
+
+        @callback
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._users -= 1
+            if not self._users:
+                self.async_stop()
+
+        return release
+
+    @callback
+    def _async_build(self) -> None:
+        """Build the index and follow changes."""
+        self._sensors = {
+            state.entity_id: state.name
+            for state in self._hass.states.async_all("sensor")
+            if self._is_temperature(state)
+        }
+        self.version += 1
+        self._remove_listeners = [
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,
+                event_filter=self._is_sensor_event,
+            ),
+            self._hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following changes."""
+        for remove in self._remove_listeners:
+            remove()
+        self._remove_listeners = []
+        self._listeners.clear()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback whenever the catalogue changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @staticmethod
+    @callback
+    def _is_sensor_event(event_data: Mapping[str, Any]) -> bool:
+        """Return True for state changes of sensors, before a job is scheduled."""
+        return event_data["entity_id"].startswith(SENSOR_PREFIX)
+
+    @staticmethod
+    def _is_temperature(state: State) -> bool:
+        """Return True if the state belongs to a temperature sensor."""
+        return state.attributes.get("device_class") == "temperature"
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the index from a state change."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data.get("new_state")
+        if new_state is not None and self._is_temperature(new_state):
+            name = new_state.name
+            if self._sensors.get(entity_id) == name:
+                return
+            self._sensors[entity_id] = name
+        elif self._sensors.pop(entity_id, None) is None:
+            return
+        self._async_changed()
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Drop sensors that were removed or renamed in the entity registry."""
+        data = event.data
+        if data["action"] == "remove":
+            entity_ids = (data["entity_id"],)
+        elif data["action"] == "update" and "old_entity_id" in data:
+            entity_ids = (data["old_entity_id"],)
+        else:
+            return
+        changed = False
+        for entity_id in entity_ids:
+            if self._sensors.pop(entity_id, None) is not None:
+                changed = True
+        if changed:
+            self._async_changed()
+
+    @callback
+    def _async_changed(self) -> None:
+        """Bump the version and notify listeners."""
+        self.version += 1
+        _LOGGER.debug("Temperature sensor index changed (%d sensors)", len(self._sensors))
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+@callback
+def async_get_temperature_sensor_index(hass: HomeAssistant) -> TemperatureSensorIndex:
+    """Return the temperature sensor index shared by all config entries."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (index := data.get(DATA_TEMPERATURE_SENSOR_INDEX)) is None:
+        index = data[DATA_TEMPERATURE_SENSOR_INDEX] = TemperatureSensorIndex(hass)
+    return index
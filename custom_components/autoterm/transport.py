@@ -0,0 +1,192 @@
+"""Event-loop driven serial transport for the Autoterm heater."""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Tuple
+
+import serial
+
+from .io_engine import AutotermIOEngine, get_io_engine
+from .network import create_network_connection, is_network_url
+
+_LOGGER = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024
+
+
+class SerialTransport(asyncio.Transport):
+    """Non-blocking serial transport fed by the shared I/O engine.
+
+    Incoming bytes are delivered to ``protocol.data_received`` as soon as the
+    port becomes readable, so there is no idle polling and no executor hop per
+    frame. Writes go straight to the file descriptor and are only buffered
+    when the kernel cannot take them immediately.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.Protocol,
+        serial_instance: serial.Serial,
+        engine: AutotermIOEngine | None = None,
+    ) -> None:
+        """Initialize the transport and start reading."""
+        super().__init__()
+        self._loop = loop
+        self._engine = engine or get_io_engine(loop)
+        self._protocol = protocol
+        self._serial = serial_instance
+        self._fd = serial_instance.fileno()
+        self._write_buffer = bytearray()
+        self._closing = False
+        self._has_writer = False
+
+        os.set_blocking(self._fd, False)
+        self._engine.add_reader(self._fd, self._read_ready)
+        self._loop.call_soon(self._protocol.connection_made, self)
+
+    @property
+    def serial(self) -> serial.Serial:
+        """Return the underlying serial instance."""
+        return self._serial
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Return transport specific information."""
+        if name == "serial":
+            return self._serial
+        return default
+
+    def is_closing(self) -> bool:
+        """Return True if the transport is closing or closed."""
+        return self._closing
+
+    def _read_ready(self) -> None:
+        """Read whatever is available and hand it to the protocol."""
+        try:
+            data = os.read(self._fd, READ_CHUNK_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as ex:
+            self._fatal_error(ex)
+            return
+
+        if not data:
+            # A readable tty returning no data means the device went away.
+            self._fatal_error(ConnectionError("Serial port closed"))
+            return
+
+        self._protocol.data_received(data)
+
+    def write(self, data: bytes) -> None:
+        """Write data to the port without blocking."""
+        if self._closing:
+            return
+
+        if not self._write_buffer:
+            try:
+                written = os.write(self._fd, data)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            except OSError as ex:
+                self._fatal_error(ex)
+                return
+            if written == len(data):
+                return
+            data = data[written:]
+
+        self._write_buffer += data
+        if not self._has_writer:
+            self._engine.add_writer(self._fd, self._write_ready)
+            self._has_writer = True
+
+    def _write_ready(self) -> None:
+        """Flush buffered data once the port accepts more bytes."""
+        try:
+            written = os.write(self._fd, self._write_buffer)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as ex:
+            self._fatal_error(ex)
+            return
+
+        del self._write_buffer[:written]
+        if not self._write_buffer:
+            self._engine.remove_writer(self._fd)
+            self._has_writer = False
+            if self._closing:
+                self._call_connection_lost(None)
+
+    def get_write_buffer_size(self) -> int:
+        """Return the number of bytes waiting to be written."""
+        return len(self._write_buffer)
+
+    def close(self) -> None:
+        """Close the transport after pending writes are flushed."""
+        if self._closing:
+            return
+        self._closing = True
+        self._engine.remove_reader(self._fd)
+        if not self._write_buffer:
+            self._loop.call_soon(self._call_connection_lost, None)
+
+    def abort(self) -> None:
+        """Close the transport immediately, dropping pending writes."""
+        self._abort(None)
+
+    def _fatal_error(self, exc: Exception) -> None:
+        """Report a fatal error and close the transport."""
+        _LOGGER.error(f"Serial transport error: {exc}")
+        self._abort(exc)
+
+    def _abort(self, exc: Exception | None) -> None:
+        """Tear down the fd callbacks and notify the protocol."""
+        self._closing = True
+        self._engine.remove_reader(self._fd)
+        if self._has_writer:
+            self._engine.remove_writer(self._fd)
+            self._has_writer = False
+        self._write_buffer.clear()
+        self._loop.call_soon(self._call_connection_lost, exc)
+
+    def _call_connection_lost(self, exc: Exception | None) -> None:
+        """Close the port and notify the protocol."""
+        if self._serial is None:
+            return
+        try:
+            self._protocol.connection_lost(exc)
+        finally:
+            self._serial.close()
+            self._serial = None
+
+
+async def create_serial_connection(
+    loop: asyncio.AbstractEventLoop,
+    protocol_factory: Callable[[], asyncio.Protocol],
+    port: str,
+    baudrate: int = 9600,
+    engine: AutotermIOEngine | None = None,
+) -> Tuple[SerialTransport, asyncio.Protocol]:
+    """Open a serial port and wire it to a protocol on the event loop."""
+    serial_instance = await loop.run_in_executor(
+        None, lambda: serial.serial_for_url(port, baudrate=baudrate, timeout=0)
+    )
+    protocol = protocol_factory()
+    transport = SerialTransport(loop, protocol, serial_instance, engine)
+    return transport, protocol
+
+
+async def open_connection(
+    loop: asyncio.AbstractEventLoop,
+    protocol_factory: Callable[[], asyncio.Protocol],
+    port: str,
+    baudrate: int = 9600,
+) -> Tuple[asyncio.Transport, asyncio.Protocol]:
+    """Connect to a local serial port or a socket:// / rfc2217:// bridge."""
+    if is_network_url(port):
+        return await create_network_connection(
+            loop, protocol_factory, port, baudrate=baudrate
+        )
+    return await create_serial_connection(
+        loop, protocol_factory, port, baudrate=baudrate
+    )
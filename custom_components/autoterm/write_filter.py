@@ -0,0 +1,46 @@
+"""Deadband and rate limit for sensor state writes."""
+
+from typing import Any
+
+
+class StateWriteFilter:
+    """Decide when a changed sensor value is worth a state write.
+
+    A change of at least ``deadband`` from the last written value is written,
+    but no sooner than ``min_interval`` seconds after the previous write. A
+    smaller change is written once the last write is ``max_age`` seconds old,
+    so the state never drifts from the heater for long.
+    """
+
+    __slots__ = ("deadband", "min_interval", "max_age", "value", "_written_at")
+
+    def __init__(self, deadband: float, min_interval: float, max_age: float) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.max_age = max_age
+        self.value: Any = None
+        self._written_at: float | None = None
+
+    def check(self, value: Any, now: float) -> float | None:
+        """Return the seconds until value should be written, None if never."""
+        if self._written_at is None:
+            return 0.0
+        if value == self.value:
+            return None
+        since = now - self._written_at
+        if self._is_significant(value):
+            return max(self.min_interval - since, 0.0)
+        return max(self.max_age - since, 0.0)
+
+    def _is_significant(self, value: Any) -> bool:
+        """Return True if value differs from the written one beyond the deadband."""
+        if not isinstance(value, (int, float)) or not isinstance(self.value, (int, float)):
+            return True
+        # Tolerate float rounding of scaled values such as 12.6 -> 12.8 V
+        return abs(value - self.value) >= self.deadband - 1e-9
+
+    def written(self, value: Any, now: float) -> None:
+        """Remember a value as written."""
+        self.value = value
+        self._written_at = now
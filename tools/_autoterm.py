@@ -0,0 +1,24 @@
+"""Import helper for running tools against the integration in this checkout.
+
+The integration's ``__init__`` pulls in Home Assistant. The protocol level
+modules do not, so the tools register ``custom_components/autoterm`` as a
+bare ``autoterm`` package and import those modules without running it.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "autoterm"
+
+
+def load_package() -> None:
+    """Make ``import autoterm.<module>`` resolve to the integration sources."""
+    if "autoterm" in sys.modules:
+        return
+    package = types.ModuleType("autoterm")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["autoterm"] = package
+
+
+load_package()
@@ -0,0 +1,156 @@
+"""Closed-loop comparison of the temperature control modes.
+
+Simulates a heated room with a heater that regulates on its integer target
+minus the integer reported temperature, either modulating its power (hold
+temperature mode) or switching on below -2 °C and off above +1 °C
+(thermostat mode, ``--thermostat``).
+The external sensor reports in 0.1 °C steps every ``--sensor-period``
+seconds; the reported value is chosen by
+``autoterm.control`` exactly as the device does it:
+
+* ``static`` - compensated reading sent whenever the sensor reports.
+* ``hysteresis`` / ``pi`` - controller advanced every control interval.
+
+For each mode the error statistics after the warm-up, the peak-to-peak swing
+and the number of temperature frames sent are printed:
+
+    python tools/bench_control.py [--target 21.3] [--thermostat] [--interval 10]
+"""
+
+import argparse
+import math
+from dataclasses import dataclass
+
+import _autoterm  # noqa: F401
+from autoterm.const import (
+    CONF_CONTROL_HYSTERESIS,
+    CONF_CONTROL_KI,
+    CONF_CONTROL_KP,
+    CONF_CONTROL_MODE,
+    CONF_CONTROL_OUTPUT_LIMIT,
+    CONTROL_MODES,
+    DEFAULT_CONTROL_HYSTERESIS,
+    DEFAULT_CONTROL_INTERVAL,
+    DEFAULT_CONTROL_KI,
+    DEFAULT_CONTROL_KP,
+    DEFAULT_CONTROL_OUTPUT_LIMIT,
+)
+from autoterm.control import create_controller, reported_temperature
+
+
+@dataclass
+class Room:
+    """Single thermal mass heated by the heater and losing heat outside."""
+
+    temperature: float = 15.0
+    outside: float = 0.0
+    heat_capacity: float = 60_000.0  # J/K
+    loss: float = 40.0  # W/K
+    heater_max: float = 2000.0  # W
+    heater_lag: float = 120.0  # s
+    output: float = 0.0  # W, current heater output
+
+    def step(self, power_fraction: float, elapsed: float) -> None:
+        """Advance by elapsed seconds at a commanded heater power."""
+        commanded = power_fraction * self.heater_max
+        self.output += (commanded - self.output) * min(1.0, elapsed / self.heater_lag)
+        flow = self.output - self.loss * (self.temperature - self.outside)
+        self.temperature += flow * elapsed / self.heat_capacity
+
+
+class Heater:
+    """The heater's own regulation on integer temperatures."""
+
+    def __init__(self, thermostat: bool) -> None:
+        """Initialize a heater in hold temperature or thermostat mode."""
+        self.thermostat = thermostat
+        self.running = True
+
+    def power(self, heater_target: int, reported: int) -> float:
+        """Return the commanded power fraction."""
+        error = heater_target - reported
+        if not self.thermostat:
+            return max(0.2, min(1.0, 0.4 + 0.2 * error))
+        if self.running and error <= -1:
+            self.running = False
+        elif not self.running and error >= 2:
+            self.running = True
+        return 0.6 if self.running else 0.0
+
+
+def simulate(mode: str, args: argparse.Namespace) -> dict:
+    """Run one mode and return its statistics."""
+    controller = create_controller(
+        {
+            CONF_CONTROL_MODE: mode,
+            CONF_CONTROL_HYSTERESIS: args.hysteresis,
+            CONF_CONTROL_KP: args.kp,
+            CONF_CONTROL_KI: args.ki,
+            CONF_CONTROL_OUTPUT_LIMIT: args.limit,
+        }
+    )
+    target = args.target
+    heater_target = math.floor(target + 0.5)
+    room = Room()
+    heater = Heater(args.thermostat)
+    reading = round(room.temperature, 1)
+    reported = reported_temperature(reading, target, heater_target, controller)
+    frames = 1
+    warm_up = args.warm_up * 3600
+    errors = []
+    low = math.inf
+    high = -math.inf
+
+    for second in range(int(args.hours * 3600)):
+        room.step(heater.power(heater_target, reported), 1.0)
+        sensor_report = second % args.sensor_period == 0
+        if sensor_report:
+            reading = round(room.temperature, 1)
+        tick = controller is not None and second % args.interval == 0
+        if tick:
+            controller.update(target - reading, args.interval)
+        if sensor_report or tick:
+            value = reported_temperature(reading, target, heater_target, controller)
+            if value != reported:
+                reported = value
+                frames += 1
+        if second >= warm_up:
+            errors.append(room.temperature - target)
+            low = min(low, room.temperature)
+            high = max(high, room.temperature)
+
+    return {
+        "mode": mode,
+        "mean": sum(errors) / len(errors),
+        "rms": math.sqrt(sum(error * error for error in errors) / len(errors)),
+        "swing": high - low,
+        "frames": frames,
+    }
+
+
+def main() -> None:
+    """Compare the control modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", type=float, default=21.3)
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--warm-up", type=float, default=2.0, help="hours ignored")
+    parser.add_argument("--interval", type=int, default=DEFAULT_CONTROL_INTERVAL)
+    parser.add_argument("--thermostat", action="store_true", help="on/off heater")
+    parser.add_argument("--sensor-period", type=int, default=60, help="seconds")
+    parser.add_argument("--hysteresis", type=float, default=DEFAULT_CONTROL_HYSTERESIS)
+    parser.add_argument("--kp", type=float, default=DEFAULT_CONTROL_KP)
+    parser.add_argument("--ki", type=float, default=DEFAULT_CONTROL_KI)
+    parser.add_argument("--limit", type=float, default=DEFAULT_CONTROL_OUTPUT_LIMIT)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'mean err':>9} {'rms err':>9} {'swing':>7} {'frames':>7}")
+    for mode in CONTROL_MODES:
+        result = simulate(mode, args)
+        print(
+            f"{result['mode']:<12} {result['mean']:>9.3f} {result['rms']:>9.3f} "
+            f"{result['swing']:>7.2f} {result['frames']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
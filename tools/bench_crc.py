@@ -0,0 +1,87 @@
+"""Micro-benchmark for the Autoterm CRC-16 implementation.
+
+Compares the table driven ``protocol.crc16`` against the original bit by bit
+loop on realistic frames and checks that both agree before timing.
+
+    python tools/bench_crc.py [--number N]
+"""
+
+import argparse
+import os
+import timeit
+
+import _autoterm  # noqa: F401
+from autoterm.protocol import calc_checksum, verify_checksum
+
+
+def bitwise_checksum(data: bytes) -> bytes:
+    """Reference implementation: the original bit by bit CRC-16/MODBUS."""
+    crc = 0xFFFF
+
+    for byte in data:
+        crc = crc ^ byte
+
+        for _ in range(8):
+            odd = crc & 0x0001
+            crc >>= 1
+
+            if odd:
+                crc ^= 0xA001
+
+    return bytes([(crc >> 8) & 0xFF, crc & 0xFF])
+
+
+def build_frame(type_value: int, message_id: int, payload: bytes) -> bytes:
+    """Build a checksummed frame."""
+    header = bytes([0xAA, type_value, len(payload), 0x00, message_id]) + payload
+    return header + bitwise_checksum(header)
+
+
+FRAMES = {
+    "status": build_frame(
+        0x04, 0x0F, bytes.fromhex("0300001b7f008201c704002d2d005000500064")
+    ),
+    "settings": build_frame(0x04, 0x02, bytes.fromhex("ffff02140304")),
+    "temperature": build_frame(0x03, 0x11, bytes([21])),
+}
+
+
+def verify() -> None:
+    """Check the table implementation against the reference."""
+    for _ in range(2000):
+        data = os.urandom(int.from_bytes(os.urandom(1), "big"))
+        assert calc_checksum(data) == bitwise_checksum(data), data.hex()
+    for name, frame in FRAMES.items():
+        assert verify_checksum(frame), name
+        assert not verify_checksum(frame[:-1] + bytes([frame[-1] ^ 1])), name
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    verify()
+
+    print(f"{'frame':<12} {'bitwise us':>11} {'table us':>9} {'verify us':>10} {'speedup':>8}")
+    for name, frame in FRAMES.items():
+        body = frame[:-2]
+        bitwise = min(
+            timeit.repeat(lambda: bitwise_checksum(body), number=args.number, repeat=5)
+        )
+        table = min(
+            timeit.repeat(lambda: calc_checksum(body), number=args.number, repeat=5)
+        )
+        check = min(
+            timeit.repeat(lambda: verify_checksum(frame), number=args.number, repeat=5)
+        )
+        scale = 1e6 / args.number
+        print(
+            f"{name:<12} {bitwise * scale:>11.2f} {table * scale:>9.2f} "
+            f"{check * scale:>10.2f} {bitwise / table:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark the shared I/O engine against one loop registration per port.
+
+Opens many pseudo terminals as simulated heaters. A child process plays the
+heaters and writes a status frame to every port each tick, while this
+process reads them through ``SerialTransport`` and ``FrameParser``. Each port
+count is run once with the multiplexed engine and once with every port
+registered with the event loop directly, and the CPU time spent by the
+reading process is reported per frame together with the number of event
+loop callbacks it took.
+
+    python tools/bench_io_engine.py [--ports 1,8,32,64] [--duration S] [--tick MS]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import tty
+
+import _autoterm  # noqa: F401
+from autoterm.io_engine import AutotermIOEngine
+from autoterm.protocol import FrameParser, build_frame
+from autoterm.transport import create_serial_connection
+
+STATUS_FRAME = build_frame(
+    0x0F, bytes.fromhex("0300001b7f008201c704002d2d005000500064"), 0x04
+)
+
+
+class CountingProtocol(asyncio.Protocol):
+    """Parse incoming frames and count them."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.parser = FrameParser()
+        self.frames = 0
+        self.reads = 0
+
+    def data_received(self, data: bytes) -> None:
+        """Count the complete frames in data."""
+        self.reads += 1
+        for _ in self.parser.feed(data):
+            self.frames += 1
+
+
+def play_heaters(masters: list[int], duration: float, tick: float) -> None:
+    """Write a status frame to every port each tick (runs in the child)."""
+    deadline = time.monotonic() + duration
+    next_tick = time.monotonic()
+    while time.monotonic() < deadline:
+        for fd in masters:
+            try:
+                os.write(fd, STATUS_FRAME)
+            except BlockingIOError:
+                pass
+        next_tick += tick
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+    os._exit(0)
+
+
+async def run(ports: int, multiplex: bool, duration: float, tick: float) -> dict:
+    """Run one configuration and return its measurements."""
+    loop = asyncio.get_running_loop()
+    engine = AutotermIOEngine(loop, multiplex=multiplex)
+    pairs = [os.openpty() for _ in range(ports)]
+    for master, slave in pairs:
+        tty.setraw(slave)
+        os.set_blocking(master, False)
+
+    connections = [
+        await create_serial_connection(
+            loop, CountingProtocol, os.ttyname(slave), engine=engine
+        )
+        for _, slave in pairs
+    ]
+    for _, slave in pairs:
+        os.close(slave)
+
+    cpu_start = time.process_time()
+    child = os.fork()
+    if child == 0:
+        play_heaters([master for master, _ in pairs], duration, tick)
+    await asyncio.sleep(duration + 0.2)
+    cpu = time.process_time() - cpu_start
+    os.waitpid(child, 0)
+
+    frames = sum(protocol.frames for _, protocol in connections)
+    reads = sum(protocol.reads for _, protocol in connections)
+    multiplexed = engine.multiplexed
+    # Without multiplexing the loop runs one callback per read
+    wakeups = engine.wakeups if multiplexed else reads
+    for transport, _ in connections:
+        transport.close()
+    await asyncio.sleep(0)
+    engine.close()
+    for master, _ in pairs:
+        os.close(master)
+
+    return {
+        "ports": ports,
+        "engine": "multiplexed" if multiplexed else "per-port",
+        "frames": frames,
+        "cpu_ms": cpu * 1000,
+        "cpu_us_per_frame": cpu * 1e6 / frames if frames else float("nan"),
+        "loop_callbacks": wakeups,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ports", default="1,8,32,64")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--tick", type=float, default=10.0, help="milliseconds")
+    args = parser.parse_args()
+
+    print(
+        f"{'ports':>5} {'engine':<12} {'frames':>7} {'cpu ms':>8} "
+        f"{'us/frame':>9} {'callbacks':>9}"
+    )
+    for ports in (int(value) for value in args.ports.split(",")):
+        for multiplex in (False, True):
+            result = await run(ports, multiplex, args.duration, args.tick / 1000)
+            print(
+                f"{result['ports']:>5} {result['engine']:<12} {result['frames']:>7} "
+                f"{result['cpu_ms']:>8.1f} {result['cpu_us_per_frame']:>9.2f} "
+                f"{result['loop_callbacks']:>9}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,254 @@
+"""Benchmark suite for the Autoterm protocol and entity hot paths.
+
+Runs every benchmark, prints a table and writes the results as JSON so runs
+from different releases can be compared:
+
+* ``crc`` - CRC-16 of a status frame.
+* ``parse`` - FrameParser throughput on a chunked byte stream.
+* ``process_message`` - decoding a status frame plus flushing the updates.
+* ``get_entity_state`` - reading every entity key once.
+* ``command_latency`` - ``AutotermClimate.async_set_hvac_mode(HEAT)`` until
+  the status frame confirming ignition, against the simulated heater.
+
+The last three need Home Assistant and are reported as skipped without it.
+
+    python tools/benchmark.py [--output results.json] [--quick]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import _autoterm  # noqa: F401
+from autoterm.protocol import FrameParser, build_frame, calc_checksum
+
+STATUS_PAYLOADS = [
+    bytes.fromhex("0300001b7f008201c704002d2d005000500064"),
+    bytes.fromhex("0300001c7f008201c804002d2e005100500064"),
+]
+SETTINGS_PAYLOAD = bytes.fromhex("ffff02140304")
+HEAT_STATUS_PREFIXES = ("2.", "3.0")
+
+
+def _timed(func, number: int, repeat: int) -> list[float]:
+    """Return the seconds per call of each repeat."""
+    return [t / number for t in timeit.repeat(func, number=number, repeat=repeat)]
+
+
+def _result(name: str, unit: str, samples: list[float], scale: float, **extra) -> dict:
+    """Summarize samples (seconds) in unit."""
+    values = sorted(sample * scale for sample in samples)
+    return {
+        "name": name,
+        "unit": unit,
+        "min": values[0],
+        "median": statistics.median(values),
+        "max": values[-1],
+        "samples": len(values),
+        **extra,
+    }
+
+
+def bench_crc(number: int, repeat: int) -> dict:
+    """Time the CRC of a status frame."""
+    body = build_frame(0x0F, STATUS_PAYLOADS[0], 0x04)[:-2]
+    return _result("crc", "us", _timed(lambda: calc_checksum(body), number, repeat), 1e6)
+
+
+def bench_parse(number: int, repeat: int) -> dict:
+    """Measure parser throughput on a stream cut into random chunks."""
+    frames = [
+        build_frame(0x0F, STATUS_PAYLOADS[0], 0x04),
+        build_frame(0x02, SETTINGS_PAYLOAD, 0x04),
+    ] * 500
+    stream = b"".join(frames)
+    rng = random.Random(0)
+    chunks = []
+    position = 0
+    while position < len(stream):
+        size = rng.randint(1, 64)
+        chunks.append(stream[position : position + size])
+        position += size
+
+    def run() -> None:
+        parser = FrameParser()
+        for chunk in chunks:
+            for _ in parser.feed(chunk):
+                pass
+
+    samples = _timed(run, max(1, number // 1000), repeat)
+    # Report frames per second, higher is better
+    return _result(
+        "parse",
+        "frames/s",
+        [1 / (sample / len(frames)) for sample in samples],
+        1,
+        bytes_per_frame=len(stream) / len(frames),
+    )
+
+
+def _make_device(hass, loop, port: str = "bench"):
+    """Create a device that is not connected."""
+    from autoterm.device import AutotermDevice
+
+    return AutotermDevice(hass, port, loop, "benchmark")
+
+
+def bench_process_message(hass, loop, number: int, repeat: int) -> dict:
+    """Time decoding a changed status frame and flushing the notifications."""
+    device = _make_device(hass, loop)
+    device.async_add_listener(("board_temp", "voltage", "status"), lambda: None)
+    frames = [build_frame(0x0F, payload, 0x04) for payload in STATUS_PAYLOADS]
+    state = {"index": 0}
+
+    def run() -> None:
+        # Alternate payloads so every frame changes some values
+        state["index"] ^= 1
+        device.process_message(frames[state["index"]])
+        device._flush_state_updates()
+
+    return _result("process_message", "us", _timed(run, number, repeat), 1e6)
+
+
+def bench_get_entity_state(hass, loop, number: int, repeat: int) -> dict:
+    """Time reading every entity key once."""
+    device = _make_device(hass, loop)
+    device.process_message(build_frame(0x0F, STATUS_PAYLOADS[0], 0x04))
+    device.process_message(build_frame(0x02, SETTINGS_PAYLOAD, 0x04))
+    keys = list(device._state_resolvers)
+    get = device.get_entity_state
+
+    def run() -> None:
+        for key in keys:
+            get(key)
+
+    samples = _timed(run, max(1, number // 10), repeat)
+    return _result(
+        "get_entity_state", "us", [s / len(keys) for s in samples], 1e6, keys=len(keys)
+    )
+
+
+async def bench_command_latency(hass, iterations: int) -> dict:
+    """Time set_hvac_mode(HEAT) until a status frame confirms ignition."""
+    from homeassistant.components.climate import HVACMode
+
+    from autoterm.climate import AutotermClimate
+    from simulator import HeaterSimulator, PhaseTiming, PtyHeater
+
+    loop = asyncio.get_running_loop()
+    heater = PtyHeater(HeaterSimulator(PhaseTiming().scaled(1000)), loop)
+    device = _make_device(hass, loop, heater.port)
+    await device.connect()
+    climate = AutotermClimate(device, "benchmark")
+    climate.hass = hass
+    climate.entity_id = "climate.autoterm_benchmark"
+    # Outside an entity platform there is no translated name to resolve
+    climate._attr_has_entity_name = False
+    climate._attr_name = "Autoterm benchmark"
+    climate._no_platform_reported = True
+
+    samples = []
+    try:
+        for _ in range(iterations):
+            start = loop.time()
+            await climate.async_set_hvac_mode(HVACMode.HEAT)
+            while not device.status_data.status_code.startswith(HEAT_STATUS_PREFIXES):
+                await device.request("status")
+            samples.append(loop.time() - start)
+
+            await climate.async_set_hvac_mode(HVACMode.OFF)
+            while device.status_data.status_code != "0.1":
+                await asyncio.sleep(0.01)
+                await device.request("status")
+    finally:
+        await device.disconnect()
+        heater.close()
+    return _result("command_latency", "ms", samples, 1e3)
+
+
+async def run_ha_benchmarks(args: argparse.Namespace) -> list[dict]:
+    """Run the benchmarks that need Home Assistant."""
+    from homeassistant.core import HomeAssistant
+
+    hass = HomeAssistant(str(Path(args.config_dir).resolve()))
+    loop = asyncio.get_running_loop()
+    try:
+        return [
+            bench_process_message(hass, loop, args.number, args.repeat),
+            bench_get_entity_state(hass, loop, args.number, args.repeat),
+            await bench_command_latency(hass, args.iterations),
+        ]
+    finally:
+        await hass.async_stop(force=True)
+
+
+def _git_revision() -> str | None:
+    """Return the current commit of the checkout, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run the suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--config-dir", default=".benchmark-config")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    args = parser.parse_args()
+    if args.quick:
+        args.number, args.repeat, args.iterations = 2000, 3, 3
+
+    results = [bench_crc(args.number, args.repeat), bench_parse(args.number, args.repeat)]
+    try:
+        import homeassistant  # noqa: F401
+    except ImportError:
+        for name in ("process_message", "get_entity_state", "command_latency"):
+            results.append({"name": name, "skipped": "homeassistant is not installed"})
+    else:
+        results.extend(asyncio.run(run_ha_benchmarks(args)))
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{'benchmark':<18} {'unit':<9} {'min':>12} {'median':>12} {'max':>12}")
+    for result in results:
+        if "skipped" in result:
+            print(f"{result['name']:<18} skipped: {result['skipped']}")
+            continue
+        print(
+            f"{result['name']:<18} {result['unit']:<9} {result['min']:>12.2f} "
+            f"{result['median']:>12.2f} {result['max']:>12.2f}"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    main()
+    print(f"Finished in {time.perf_counter() - start:.1f} s")
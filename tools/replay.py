@@ -0,0 +1,77 @@
+"""Replay a traffic capture into AutotermDevice.
+
+Feeds the received chunks of a capture written by the ``capture_traffic``
+option through the device's frame parser and message handling, either with
+the original timing (optionally sped up) or as fast as possible, and prints
+the decoding rate and the final heater state:
+
+    python tools/replay.py CAPTURE [--speed X | --fast] [--frames]
+
+Needs Home Assistant for the device; the file is memory-mapped, so captures
+of any length replay in constant memory.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import _autoterm  # noqa: F401
+from autoterm.capture import CaptureReader, replay
+from autoterm.frame_log import DIRECTIONS
+
+
+def print_records(reader: CaptureReader) -> None:
+    """Print every record of a capture."""
+    for timestamp, direction, data in reader:
+        moment = datetime.fromtimestamp(timestamp).isoformat(timespec="milliseconds")
+        print(f"{moment} {DIRECTIONS[direction]} {data.hex()}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Replay the capture and report."""
+    from homeassistant.core import HomeAssistant
+
+    from autoterm.device import AutotermDevice
+
+    hass = HomeAssistant(str(Path(args.config_dir).resolve()))
+    loop = asyncio.get_running_loop()
+    device = AutotermDevice(hass, args.capture, loop, "replay")
+    try:
+        with CaptureReader(args.capture) as reader:
+            start = time.perf_counter()
+            chunks = await replay(reader, device._handle_data, None if args.fast else args.speed)
+            elapsed = time.perf_counter() - start
+        frames = device.parser.stats["frames_ok"]
+        print(f"{chunks} chunks, {frames} frames in {elapsed:.3f} s", end="")
+        if elapsed:
+            print(f" ({frames / elapsed:.0f} frames/s)")
+        print(f"parser: {device.parser.stats}")
+        print(f"version: {device.version}")
+        print(f"status: {json.dumps(device.status_data.as_dict())}")
+        print(f"settings: {json.dumps(device.settings_data.as_dict())}")
+    finally:
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse the arguments and replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture")
+    parser.add_argument("--speed", type=float, default=1.0, help="time scale")
+    parser.add_argument("--fast", action="store_true", help="as fast as possible")
+    parser.add_argument("--frames", action="store_true", help="only print the records")
+    parser.add_argument("--config-dir", default=".replay-config")
+    args = parser.parse_args()
+
+    if args.frames:
+        with CaptureReader(args.capture) as reader:
+            print_records(reader)
+        return
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Virtual Autoterm Air 2D heater on a pseudo-terminal.
+
+Answers version, status, settings, temperature, heat, off and fan_only
+requests with checksummed response frames and walks through the start-up,
+heating and cool-down phases on a configurable schedule. Point the
+integration (or ``AutotermDevice.connect``) at the printed port path.
+
+    python tools/simulator.py [--count N] [--tcp PORT] [--speed X] ...
+
+The classes can also be imported by tests and benchmarks::
+
+    heater = PtyHeater(HeaterSimulator(), loop)
+    device = AutotermDevice(hass, heater.port, loop, "entry")
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+import tty
+from dataclasses import dataclass
+from typing import Callable
+
+import _autoterm  # noqa: F401
+from autoterm.const import MESSAGE_IDS
+from autoterm.protocol import (
+    SETTINGS_CODEC,
+    STATUS_CODEC,
+    FrameParser,
+    build_frame,
+)
+
+_LOGGER = logging.getLogger("autoterm.simulator")
+
+RESPONSE_TYPE = 0x04
+VERSION = bytes([1, 2, 3, 4, 5])
+DEFAULT_SETTINGS = SETTINGS_CODEC.encode(
+    {"work_time": 0xFFFF, "sensor": 2, "temperature_target": 20, "mode": 3, "level": 4}
+)
+
+
+@dataclass
+class PhaseTiming:
+    """Seconds spent in each phase of a start or stop."""
+
+    glow_plug: float = 10.0
+    ignition: float = 20.0
+    chamber: float = 30.0
+    cool_down: float = 60.0
+    flame_sensor: float = 15.0
+
+    def scaled(self, speed: float) -> "PhaseTiming":
+        """Return the timing sped up by a factor."""
+        return PhaseTiming(*(value / speed for value in vars(self).values()))
+
+
+# Readings reported in each status code: fan rpm (x60), flame K,
+# fuel pump frequency (Hz) and glow plug current (A)
+PHASE_READINGS = {
+    "0.1": (0, 290, 0.0, 0.0),
+    "1.0": (30, 330, 0.0, 0.0),
+    "2.0": (20, 300, 0.0, 8.5),
+    "2.1": (30, 320, 0.6, 8.5),
+    "2.2": (40, 380, 1.0, 4.0),
+    "2.4": (60, 430, 1.5, 0.0),
+    "3.0": (70, 455, 1.8, 0.0),
+    "3.35": (60, 290, 0.0, 0.0),
+    "3.4": (80, 400, 0.0, 0.0),
+}
+
+
+class HeaterSimulator:
+    """Protocol level model of the heater.
+
+    Phases follow a schedule of (status code, duration) steps started by the
+    heat, off and fan_only commands; the last step lasts until the next
+    command. ``clock`` defaults to ``time.monotonic`` and can be replaced to
+    step time explicitly.
+    """
+
+    def __init__(
+        self,
+        timing: PhaseTiming | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the simulator in standby."""
+        self.timing = timing or PhaseTiming()
+        self.clock = clock
+        self.settings = DEFAULT_SETTINGS
+        self.panel_temperature = 20
+        self.board_temperature = 18
+        self.voltage = 12.6
+        self.error_code = 0
+        self.frames = 0
+        self._schedule: list[tuple[str, float]] = [("0.1", 0.0)]
+        self._schedule_start = self.clock()
+
+    @property
+    def status_code(self) -> str:
+        """Return the status code for the current time."""
+        elapsed = self.clock() - self._schedule_start
+        for code, duration in self._schedule[:-1]:
+            if elapsed < duration:
+                return code
+            elapsed -= duration
+        return self._schedule[-1][0]
+
+    def _start_schedule(self, *steps: tuple[str, float]) -> None:
+        """Start a new phase schedule now."""
+        self._schedule = list(steps)
+        self._schedule_start = self.clock()
+        _LOGGER.info("Phase schedule: %s", " -> ".join(code for code, _ in steps))
+
+    def heat(self) -> None:
+        """Run the ignition sequence and keep heating."""
+        if self.status_code == "3.0":
+            return
+        timing = self.timing
+        third = timing.ignition / 3
+        self._start_schedule(
+            ("2.0", timing.glow_plug),
+            ("2.1", third),
+            ("2.2", third),
+            ("2.3", third),
+            ("2.4", timing.chamber),
+            ("3.0", 0.0),
+        )
+
+    def fan_only(self) -> None:
+        """Run the fan without combustion."""
+        self._start_schedule(("3.35", 0.0))
+
+    def off(self) -> None:
+        """Cool down and go to standby."""
+        code = self.status_code
+        if code == "0.1":
+            return
+        if code.startswith("2") or code == "3.0":
+            timing = self.timing
+            self._start_schedule(
+                ("3.4", timing.cool_down), ("1.0", timing.flame_sensor), ("0.1", 0.0)
+            )
+        else:
+            self._start_schedule(("0.1", 0.0))
+
+    def status_payload(self) -> bytes:
+        """Return the status payload for the current phase."""
+        code = self.status_code
+        major, minor = (int(part) for part in code.split("."))
+        fan, flame, pump, glow = PHASE_READINGS.get(code, PHASE_READINGS["0.1"])
+        level = SETTINGS_CODEC.decode(self.settings).level
+        if code in ("3.0", "3.35"):
+            fan = min(fan + level * 4, 255)
+            pump = min(pump + level * 0.15, 2.55) if pump else 0.0
+        return STATUS_CODEC.encode(
+            {
+                "status_major": major,
+                "status_minor": minor,
+                "error_code": self.error_code,
+                "board_temp": self.board_temperature,
+                "external_temp": self.panel_temperature,
+                "voltage": self.voltage,
+                "flame_temperature": flame,
+                "fan_rpm_specified": fan * 60,
+                "fan_rpm_actual": max(fan - 1, 0) * 60,
+                "frequency_fuel_pump": pump,
+                "frequency_fuel_pump_actual": pump,
+                "glow_plug_current": glow,
+            }
+        )
+
+    def handle(self, message_id: int, payload: bytes) -> bytes | None:
+        """Return the response payload for a request, or None to stay silent."""
+        self.frames += 1
+        key = MESSAGE_IDS.get(message_id)
+        if key == "version":
+            return VERSION
+        if key == "status":
+            return self.status_payload()
+        if key == "settings":
+            if payload:
+                self.settings = SETTINGS_CODEC.encode({}, payload)
+            return self.settings
+        if key == "temperature":
+            if payload:
+                self.panel_temperature = payload[0]
+            return bytes([self.panel_temperature])
+        if key == "heat":
+            if payload:
+                self.settings = SETTINGS_CODEC.encode({}, payload)
+            self.heat()
+            return self.settings
+        if key == "fan_only":
+            if len(payload) >= 3:
+                self.settings = SETTINGS_CODEC.encode({"level": payload[2]}, self.settings)
+            self.fan_only()
+            return payload
+        if key == "off":
+            self.off()
+            return b""
+        return None
+
+
+class PtyHeater:
+    """Serve a HeaterSimulator on a pseudo-terminal."""
+
+    def __init__(
+        self,
+        simulator: HeaterSimulator,
+        loop: asyncio.AbstractEventLoop,
+        latency: float = 0.0,
+    ) -> None:
+        """Open the pty and start answering requests."""
+        self.simulator = simulator
+        self._loop = loop
+        self._latency = latency
+        self._parser = FrameParser()
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self.port = os.ttyname(self._slave)
+        loop.add_reader(self._master, self._read)
+
+    def _read(self) -> None:
+        """Answer every complete request frame."""
+        try:
+            data = os.read(self._master, 1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            # The device side of the pty was closed
+            return
+        for frame in self._parser.feed(data):
+            response = self.simulator.handle(frame[4], bytes(frame[5:-2]))
+            if response is None:
+                continue
+            out = build_frame(frame[4], response, RESPONSE_TYPE)
+            if self._latency:
+                self._loop.call_later(self._latency, self._write, out)
+            else:
+                self._write(out)
+
+    def _write(self, data: bytes) -> None:
+        """Write a response frame."""
+        try:
+            os.write(self._master, data)
+        except OSError as ex:
+            _LOGGER.debug("Dropped response: %s", ex)
+
+    def close(self) -> None:
+        """Close the pty."""
+        self._loop.remove_reader(self._master)
+        os.close(self._master)
+        os.close(self._slave)
+
+
+async def serve_tcp(simulator: HeaterSimulator, port: int) -> asyncio.AbstractServer:
+    """Serve a HeaterSimulator as a socket:// bridge on localhost."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        parser = FrameParser()
+        while data := await reader.read(1024):
+            for frame in parser.feed(data):
+                response = simulator.handle(frame[4], bytes(frame[5:-2]))
+                if response is not None:
+                    writer.write(build_frame(frame[4], response, RESPONSE_TYPE))
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", port)
+
+
+async def main() -> None:
+    """Run simulated heaters until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1, help="number of heaters")
+    parser.add_argument("--tcp", type=int, help="also serve the first heater on this TCP port")
+    parser.add_argument("--speed", type=float, default=1.0, help="phase time scale")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in ms")
+    defaults = PhaseTiming()
+    for name, value in vars(defaults).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=float, default=value,
+            help=f"seconds (default {value})",
+        )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    timing = PhaseTiming(*(getattr(args, name) for name in vars(defaults))).scaled(args.speed)
+    loop = asyncio.get_running_loop()
+    heaters = [
+        PtyHeater(HeaterSimulator(timing), loop, args.latency / 1000)
+        for _ in range(args.count)
+    ]
+    for heater in heaters:
+        print(heater.port, flush=True)
+    if args.tcp:
+        await serve_tcp(heaters[0].simulator, args.tcp)
+        print(f"socket://127.0.0.1:{args.tcp}", flush=True)
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass